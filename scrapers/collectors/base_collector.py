@@ -28,6 +28,11 @@ class BaseCollector(ABC):
     - Data validation
     """
     
+    # Connection pools shared by every collector in the process, keyed by
+    # retry settings; urllib3 pools are thread-safe, so sessions stay
+    # per-instance while keep-alive connections are reused across them
+    _shared_adapters: Dict[tuple, HTTPAdapter] = {}
+    
     def __init__(self, 
                 cache_enabled: bool = True,
                 cache_expiry: int = 86400, # 24 hours in seconds
@@ -73,15 +78,19 @@ class BaseCollector(ABC):
         """Create a requests session with retry configuration"""
         session = requests.Session()
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
-        )
+        adapter = BaseCollector._shared_adapters.get((max_retries, backoff_factor))
+        if adapter is None:
+            # Configure retry strategy
+            retry_strategy = Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"]
+            )
+            
+            adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=10, pool_maxsize=20)
+            adapter = BaseCollector._shared_adapters.setdefault((max_retries, backoff_factor), adapter)
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -126,14 +126,19 @@ class BrunswickCodeViolationsCollector(BaseCollector):
         """
         session = requests.Session()
         
+        # This collector only issues GETs, so retries are limited to GET and
+        # left entirely to urllib3; exhausted retries return the last response
+        # instead of raising so callers handle it via raise_for_status()
         retry_strategy = Retry(
             total=self.retry_attempts,
             backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_block=False)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -395,43 +400,45 @@ class BrunswickCodeViolationsCollector(BaseCollector):
         leads = []
         
         for violation in violations:
+            g = violation.get
+
             # Skip violations with missing essential data
-            if not violation.get("property_address"):
+            if not g("property_address"):
                 continue
                 
             # Determine lead score based on violation severity and status
             lead_score = 50  # Base score
             
             # Increase score for open/recent violations
-            if violation.get("status") in ["Open", "Pending Compliance", "Hearing Scheduled"]:
+            if g("status") in ["Open", "Pending Compliance", "Hearing Scheduled"]:
                 lead_score += 15
             
             # Increase score for severe violations
-            if violation.get("severity", 0) >= 4:
+            if g("severity", 0) >= 4:
                 lead_score += 20
-            elif violation.get("severity", 0) >= 2:
+            elif g("severity", 0) >= 2:
                 lead_score += 10
                 
             # Increase score for properties with multiple violations
-            if violation.get("has_prior_violations", False):
-                lead_score += min(violation.get("prior_violations_count", 0) * 5, 20)
+            if g("has_prior_violations", False):
+                lead_score += min(g("prior_violations_count", 0) * 5, 20)
                 
             # Create standardized lead object
             lead = {
                 "lead_id": f"brunswick-violation-{violation['case_id']}",
-                "property_id": violation.get("case_id", ""),
+                "property_id": g("case_id", ""),
                 "source": "brunswick_code_violations",
                 "source_location": "Brunswick",
                 "property_address": violation["property_address"],
-                "owner_name": violation.get("owner_name", ""),
+                "owner_name": g("owner_name", ""),
                 "date_added": datetime.now().strftime("%Y-%m-%d"),
                 "lead_score": lead_score,
                 "has_code_violation": True,
-                "violation_type": violation.get("violation_type", "Unknown"),
-                "violation_severity": str(violation.get("severity", 1)),
-                "violation_status": violation.get("status", "Unknown"),
-                "violation_date": violation.get("violation_date", ""),
-                "notes": violation.get("notes", ""),
+                "violation_type": g("violation_type", "Unknown"),
+                "violation_severity": str(g("severity", 1)),
+                "violation_status": g("status", "Unknown"),
+                "violation_date": g("violation_date", ""),
+                "notes": g("notes", ""),
                 "data_json": json.dumps(violation)  # Store full violation data in JSON
             }
             
@@ -1,47 +1,557 @@
 """
-Brunswick-specific data collector for demographic, environmental, and education data
+Brunswick-specific data collector for municipal, demographic, environmental,
+and education data
 """
 import aiohttp
 import asyncio
+import base64
 from bs4 import BeautifulSoup
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
+import os
+import time
 from datetime import datetime
-import pandas as pd
+from operator import itemgetter
+from pathlib import Path
+from urllib.parse import urlencode
 import re
+from dateutil.relativedelta import relativedelta
+
+from .url_finder import BrunswickUrlFinder
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    json_loads = json.loads
+
+# selectolax is much faster than BeautifulSoup for the Census table scans
+SELECTOLAX_AVAILABLE = False
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    logging.warning("selectolax not available, falling back to BeautifulSoup. Install with: pip install selectolax")
+
+# zstd-compress on-disk cache entries when zstandard is installed
+ZSTD_AVAILABLE = False
+try:
+    import zstandard as zstd
+    _ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=3)
+    _ZSTD_DECOMPRESSOR = zstd.ZstdDecompressor()
+    ZSTD_AVAILABLE = True
+except ImportError:
+    pass
+
+# pyarrow is optional; it is only needed for columnar (as_arrow) output
+PYARROW_AVAILABLE = False
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pass
+
+# How long discovered source URLs stay valid on disk
+URL_CACHE_TTL = 24 * 60 * 60
+
+# Failures a source scrape is expected to hit (network, timeouts, bad
+# payloads); anything else is a bug and propagates
+SCRAPE_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+
+# Everything that isn't part of a number ($, commas, whitespace)
+_CURRENCY_RE = re.compile(r'[^\d.\-]')
+
+# Field order of the tuples built by _parse_assessment_row
+_ASSESSMENT_COLUMNS = (
+    'parcel_id', 'address', 'owner_name', 'land_value', 'building_value',
+    'total_value', 'assessment_year'
+)
+
+# API keys and the field names they map to, in matching order
+_PERMIT_KEYS = (
+    'permitNumber', 'permitType', 'status', 'issueDate', 'expirationDate',
+    'propertyAddress', 'workDescription', 'estimatedCost', 'contractorName'
+)
+_PERMIT_FIELDS = (
+    'permit_number', 'type', 'status', 'issue_date', 'expiration_date',
+    'address', 'description', 'estimated_cost', 'contractor'
+)
+_PERMIT_GETTER = itemgetter(*_PERMIT_KEYS)
+
+_VIOLATION_KEYS = (
+    'caseNumber', 'violationType', 'status', 'openDate', 'closeDate',
+    'propertyAddress', 'description'
+)
+_VIOLATION_FIELDS = (
+    'case_number', 'type', 'status', 'open_date', 'close_date',
+    'address', 'description'
+)
+_VIOLATION_GETTER = itemgetter(*_VIOLATION_KEYS)
+
+# Column schemas for the typed municipal collections; others are inferred
+if PYARROW_AVAILABLE:
+    _ARROW_SCHEMAS = {
+        'assessments': pa.schema([
+            ('parcel_id', pa.string()),
+            ('address', pa.string()),
+            ('owner_name', pa.string()),
+            ('land_value', pa.float64()),
+            ('building_value', pa.float64()),
+            ('total_value', pa.float64()),
+            ('assessment_year', pa.int32())
+        ]),
+        'permits': pa.schema([
+            ('permit_number', pa.string()),
+            ('type', pa.string()),
+            ('status', pa.string()),
+            ('issue_date', pa.string()),
+            ('expiration_date', pa.string()),
+            ('address', pa.string()),
+            ('description', pa.string()),
+            ('estimated_cost', pa.float64()),
+            ('contractor', pa.string())
+        ]),
+        'violations': pa.schema([
+            ('case_number', pa.string()),
+            ('type', pa.string()),
+            ('status', pa.string()),
+            ('open_date', pa.string()),
+            ('close_date', pa.string()),
+            ('address', pa.string()),
+            ('description', pa.string())
+        ])
+    }
+
+def _extract(item: Dict, getter: itemgetter, keys: tuple) -> tuple:
+    """Pull keys from an API record, using None for any that are missing"""
+    try:
+        return getter(item)
+    except KeyError:
+        return tuple(item.get(key) for key in keys)
 
 class BrunswickDataCollector:
-    def __init__(self, config: Dict):
+    def __init__(self, config: Optional[Dict] = None, force_refresh: bool = False):
+        config = config or {}
         self.config = config
+        self.force_refresh = force_refresh
         self.logger = logging.getLogger(__name__)
         self.cache_dir = config.get('cache_dir', 'cache')
         self.session = None
+        self._connector = None
         self.urls = {}
         self.url_finder = BrunswickUrlFinder(config)
         
+        # Town of Brunswick municipal endpoints
+        self.base_urls = {
+            'assessor': 'https://gis.brunswickme.org/assessor',
+            'permits': 'https://brunswickme.org/permits',
+            'clerk': 'https://brunswickme.org/clerk',
+            'planning': 'https://brunswickme.org/planning'
+        }
+        
+        # Timestamp shared by every sub-collection of one municipal run
+        self._now = None
+        self._year = None
+        
+        # Validators and bodies for conditional GETs, keyed by request URL
+        self._etag_cache = None
+        self._etag_cache_dirty = False
+        
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        # Find URLs first
-        async with self.url_finder as finder:
-            self.urls = await finder.find_all_urls()
+        # Census and the other sources are re-hit across collectors, so keep
+        # DNS results and keep-alive connections around between requests
+        self._connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            keepalive_timeout=60
+        )
+        self.session = aiohttp.ClientSession(
+            connector=self._connector,
+            timeout=aiohttp.ClientTimeout(total=30, connect=5),
+            headers={
+                'Accept-Encoding': 'gzip, deflate',
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            }
+        )
+        # Find URLs first, reusing the last discovery run while it is fresh
+        self.urls = self._load_cached_urls()
+        if not self.urls:
+            async with self.url_finder as finder:
+                self.urls = await finder.find_all_urls()
+            self._save_cached_urls(self.urls)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._etag_cache_dirty:
+            self._write_cache('etag', self._etag_cache)
+            self._etag_cache_dirty = False
         if self.session:
             await self.session.close()
+        if self._connector and not self._connector.closed:
+            await self._connector.close()
             
-    async def collect_demographic_data(self) -> Dict:
-        """Collect demographic data from Census QuickFacts and Census Reporter"""
+    def _cache_path(self, name: str) -> Path:
+        suffix = '.json.zst' if ZSTD_AVAILABLE else '.json'
+        return Path(self.cache_dir) / f"{name}{suffix}"
+        
+    def _read_cache(self, name: str, ttl: float) -> Optional[Dict]:
+        """
+        Read a cached payload if present and younger than ttl seconds.
+        Legacy plain-JSON entries are rewritten compressed on first read.
+        """
+        cache_path = self._cache_path(name)
+        legacy_path = Path(self.cache_dir) / f"{name}.json"
+        migrate = ZSTD_AVAILABLE and not cache_path.exists() and legacy_path.exists()
+        if migrate:
+            cache_path = legacy_path
+        if not cache_path.exists():
+            return None
+            
+        stat = cache_path.stat()
+        if time.time() - stat.st_mtime >= ttl:
+            return None
+        try:
+            raw = cache_path.read_bytes()
+            if cache_path.suffix == '.zst':
+                raw = _ZSTD_DECOMPRESSOR.decompress(raw)
+            data = json_loads(raw)
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable cache %s: %s", cache_path, e)
+            return None
+            
+        if migrate and self._write_cache(name, data):
+            # Keep the original age so the TTL is not extended by the rewrite
+            os.utime(self._cache_path(name), (stat.st_atime, stat.st_mtime))
+            legacy_path.unlink(missing_ok=True)
+        return data
+        
+    def _write_cache(self, name: str, data: Dict) -> bool:
+        """Write a payload to the cache, zstd-compressed when available"""
+        cache_path = self._cache_path(name)
+        try:
+            raw = json_dumps(data)
+            if ZSTD_AVAILABLE:
+                raw = _ZSTD_COMPRESSOR.compress(raw)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(raw)
+            return True
+        except OSError as e:
+            self.logger.warning("Could not write cache %s: %s", cache_path, e)
+            return False
+            
+    def _load_cached_urls(self) -> Dict[str, str]:
+        """Load discovered URLs from disk if present and within the TTL"""
+        if self.force_refresh:
+            return {}
+        return self._read_cache('brunswick_urls', URL_CACHE_TTL) or {}
+            
+    def _save_cached_urls(self, urls: Dict[str, str]):
+        """Persist discovered URLs for later runs"""
+        self._write_cache('brunswick_urls', urls)
+            
+    def run_sync(self, as_arrow: bool = False) -> Dict:
+        """
+        Blocking entry point for callers of the former synchronous
+        collector; opens the session and returns collect_municipal_data()
+        """
+        async def run():
+            async with self:
+                return await self.collect_municipal_data(as_arrow=as_arrow)
+        return asyncio.run(run())
+        
+    async def collect_all(self) -> Dict:
+        """Collect municipal, demographic, environmental and education data concurrently"""
+        metadata = {
+            'collection_date': datetime.now().isoformat(),
+            'source': 'Brunswick Data'
+        }
+        tasks = {
+            'municipal': self.collect_municipal_data(),
+            'demographic': self.collect_demographic_data(),
+            'environmental': self.collect_environmental_data(),
+            'education': self.collect_education_data()
+        }
+        
+        # Let every source finish, so none is left running with its result
+        # unretrieved, before reporting a failure
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        failures = [(key, result) for key, result in zip(tasks, results) if isinstance(result, BaseException)]
+        if failures:
+            for key, error in failures:
+                self.logger.error("Error collecting %s data: %s", key, error, exc_info=error)
+            return {
+                'success': False,
+                'error': '; '.join(f"{key}: {error}" for key, error in failures),
+                'metadata': metadata
+            }
+            
+        return {
+            'success': True,
+            'data': dict(zip(tasks, results)),
+            'metadata': metadata
+        }
+        
+    async def collect_municipal_data(self, as_arrow: bool = False) -> Dict:
+        """
+        Collect all Brunswick municipal data
+        
+        Args:
+            as_arrow: Return each collection as a columnar pyarrow Table
+                instead of a list of dicts
+        """
+        self._now = datetime.now()
+        self._year = self._now.year
+        metadata = {
+            'collection_date': self._now.isoformat(),
+            'source': 'Brunswick Municipal Data'
+        }
+        try:
+            self.logger.info("Collecting all Brunswick data")
+            
+            tasks = {
+                # Columnar output is built straight from the row tuples
+                'assessments': self._collect_assessment_rows() if as_arrow else self.collect_assessments(),
+                'permits': self.collect_permits(),
+                'violations': self.collect_violations(),
+                'zoning_appeals': self.collect_zoning_appeals(),
+                'business_licenses': self.collect_business_licenses(),
+                'utility_data': self.collect_utility_data(),
+                'planning_board': self.collect_planning_board(),
+                'historic_district': self.collect_historic_district()
+            }
+            
+            # Each sub-collection is an independent request, so issue them
+            # concurrently over the shared session
+            results = await asyncio.gather(*tasks.values())
+            collected_data = dict(zip(tasks.keys(), results))
+            
+            if as_arrow:
+                assessment_rows = collected_data.pop('assessments')
+                collected_data = {
+                    'assessments': self._assessments_to_arrow(assessment_rows),
+                    **self.to_arrow(collected_data)
+                }
+            
+            return {
+                'success': True,
+                'data': collected_data,
+                'metadata': metadata
+            }
+            
+        except Exception as e:
+            self.logger.error("Error collecting Brunswick data: %s", e)
+            return {
+                'success': False,
+                'error': str(e),
+                'metadata': metadata
+            }
+            
+        finally:
+            self._now = None
+            self._year = None
+            
+    @staticmethod
+    def to_arrow(collected_data: Dict[str, List[Dict]]) -> Dict:
+        """Convert each collected list of records into a pyarrow Table"""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for columnar output. Install with: pip install pyarrow")
+        return {
+            key: pa.Table.from_pylist(records, schema=_ARROW_SCHEMAS.get(key))
+            for key, records in collected_data.items()
+        }
+        
+    @staticmethod
+    def _assessments_to_arrow(rows: List[Tuple]) -> "pa.Table":
+        """Build the assessments Table column-wise from row tuples"""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for columnar output. Install with: pip install pyarrow")
+        schema = _ARROW_SCHEMAS['assessments']
+        columns = list(zip(*rows)) or [()] * len(schema)
+        return pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+            schema=schema
+        )
+        
+    async def collect_assessments(self) -> List[Dict]:
+        """Collect detailed assessment data"""
+        rows = await self._collect_assessment_rows()
+        return [dict(zip(_ASSESSMENT_COLUMNS, row)) for row in rows]
+        
+    async def _collect_assessment_rows(self) -> List[Tuple]:
+        """Collect assessment data as tuples ordered like _ASSESSMENT_COLUMNS"""
+        try:
+            # Brunswick uses Vision Government Solutions
+            url = f"{self.base_urls['assessor']}/search"
+            year = self._year or datetime.now().year
+            
+            # Example search parameters
+            params = {
+                'type': 'address',
+                'value': '',
+                'year': year
+            }
+            
+            # Collect and parse assessment data
+            text = (await self._get(url, params=params)).decode('utf-8', errors='replace')
+            if SELECTOLAX_AVAILABLE:
+                rows = (
+                    [cell.text(strip=True) for cell in row.css('td')]
+                    for row in HTMLParser(text).css('tr.assessment-row')
+                )
+            else:
+                soup = BeautifulSoup(text, 'html.parser')
+                rows = (
+                    [cell.get_text(strip=True) for cell in row.find_all('td')]
+                    for row in soup.find_all('tr', class_='assessment-row')
+                )
+            
+            results = []
+            for cells in rows:
+                assessment = self._parse_assessment_row(cells, year)
+                if assessment:
+                    results.append(assessment)
+            
+            return results
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error collecting assessments: %s", e)
+            return []
+            
+    async def collect_permits(self) -> List[Dict]:
+        """Collect building and other permit data"""
+        try:
+            url = f"{self.base_urls['permits']}/search"
+            now = self._now or datetime.now()
+            
+            # Last 12 months of permits
+            params = {
+                'start_date': (now - relativedelta(months=12)).strftime('%Y-%m-%d'),
+                'end_date': now.strftime('%Y-%m-%d')
+            }
+            
+            return self._parse_permit_data(await self._fetch_json(url, params=params))
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error collecting permits: %s", e)
+            return []
+            
+    async def collect_violations(self) -> List[Dict]:
+        """Collect code violations and complaints"""
+        try:
+            url = f"{self.base_urls['planning']}/violations"
+            return self._parse_violation_data(await self._fetch_json(url))
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error collecting violations: %s", e)
+            return []
+            
+    async def collect_zoning_appeals(self) -> List[Dict]:
+        """Collect zoning board of appeals data"""
+        try:
+            url = f"{self.base_urls['planning']}/appeals"
+            return self._parse_records(await self._fetch_json(url), 'appeals')
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error collecting appeals: %s", e)
+            return []
+            
+    async def collect_business_licenses(self) -> List[Dict]:
+        """Collect business license data"""
+        try:
+            url = f"{self.base_urls['clerk']}/business-licenses"
+            return self._parse_records(await self._fetch_json(url), 'licenses')
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error collecting licenses: %s", e)
+            return []
+            
+    async def collect_utility_data(self) -> List[Dict]:
+        """Collect utility usage and account data"""
         try:
-            # Census QuickFacts data
-            quickfacts_data = await self._scrape_census_quickfacts()
+            # Brunswick & Topsham Water District
+            url = f"{self.base_urls['assessor']}/utilities"
+            return self._parse_records(await self._fetch_json(url), 'utilities')
             
-            # Census Reporter data
-            reporter_data = await self._scrape_census_reporter()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error collecting utility data: %s", e)
+            return []
             
-            # Town demographic report data
-            town_data = await self._scrape_town_demographics()
+    async def collect_planning_board(self) -> List[Dict]:
+        """Collect planning board decisions and applications"""
+        try:
+            url = f"{self.base_urls['planning']}/board"
+            return self._parse_records(await self._fetch_json(url), 'applications')
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error collecting planning data: %s", e)
+            return []
+            
+    async def collect_historic_district(self) -> List[Dict]:
+        """Collect historic district properties and regulations"""
+        try:
+            url = f"{self.base_urls['planning']}/historic"
+            return self._parse_records(await self._fetch_json(url), 'properties')
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error collecting historic data: %s", e)
+            return []
+            
+    async def _fetch_json(self, url: str, params: Optional[Dict] = None):
+        """GET a URL over the shared session and decode its JSON body"""
+        return json_loads(await self._get(url, params=params))
+        
+    async def _get(self, url: str, params: Optional[Dict] = None) -> bytes:
+        """
+        Conditional GET for slowly-changing municipal endpoints. Sends the
+        stored ETag/Last-Modified validators and returns the cached body on
+        304 Not Modified; validated 200 responses are stored for next time.
+        """
+        if self._etag_cache is None:
+            self._etag_cache = self._read_cache('etag', float('inf')) or {}
+            
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        cached = self._etag_cache.get(key)
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+                
+        async with self.session.get(url, params=params, headers=headers) as response:
+            if response.status == 304 and cached:
+                return base64.b64decode(cached['body'])
+            body = await response.read()
+            
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if response.status == 200 and (etag or last_modified):
+                self._etag_cache[key] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'body': base64.b64encode(body).decode('ascii')
+                }
+                self._etag_cache_dirty = True
+            return body
+        
+    async def collect_demographic_data(self) -> Dict:
+        """Collect demographic data from Census QuickFacts and Census Reporter"""
+        try:
+            # Census QuickFacts, Census Reporter and town report hit independent
+            # hosts, so fetch them concurrently
+            quickfacts_data, reporter_data, town_data = self._drop_failures(
+                'demographic',
+                await asyncio.gather(
+                    self._scrape_census_quickfacts(),
+                    self._scrape_census_reporter(),
+                    self._scrape_town_demographics(),
+                    return_exceptions=True
+                )
+            )
             
             # Combine and normalize data
             combined_data = self._combine_demographic_data(
@@ -53,17 +563,21 @@ class BrunswickDataCollector:
             return combined_data
             
         except Exception as e:
-            self.logger.error(f"Error collecting demographic data: {str(e)}")
+            self.logger.error("Error collecting demographic data: %s", e)
             raise
             
     async def collect_environmental_data(self) -> Dict:
         """Collect environmental data from EPA and FEMA sources"""
         try:
-            # EPA Superfund data
-            superfund_data = await self._scrape_epa_superfund()
-            
-            # FEMA flood data
-            flood_data = await self._scrape_fema_flood()
+            # EPA Superfund and FEMA flood data
+            superfund_data, flood_data = self._drop_failures(
+                'environmental',
+                await asyncio.gather(
+                    self._scrape_epa_superfund(),
+                    self._scrape_fema_flood(),
+                    return_exceptions=True
+                )
+            )
             
             # Combine environmental data
             environmental_data = {
@@ -75,17 +589,21 @@ class BrunswickDataCollector:
             return environmental_data
             
         except Exception as e:
-            self.logger.error(f"Error collecting environmental data: {str(e)}")
+            self.logger.error("Error collecting environmental data: %s", e)
             raise
             
     async def collect_education_data(self) -> Dict:
         """Collect education data from NCES and Maine DOE"""
         try:
-            # NCES data
-            nces_data = await self._scrape_nces_data()
-            
-            # Maine DOE data
-            doe_data = await self._scrape_maine_doe()
+            # NCES and Maine DOE data
+            nces_data, doe_data = self._drop_failures(
+                'education',
+                await asyncio.gather(
+                    self._scrape_nces_data(),
+                    self._scrape_maine_doe(),
+                    return_exceptions=True
+                )
+            )
             
             # Combine education data
             education_data = {
@@ -97,7 +615,7 @@ class BrunswickDataCollector:
             return education_data
             
         except Exception as e:
-            self.logger.error(f"Error collecting education data: {str(e)}")
+            self.logger.error("Error collecting education data: %s", e)
             raise
             
     async def _scrape_census_quickfacts(self) -> Dict:
@@ -106,10 +624,17 @@ class BrunswickDataCollector:
         try:
             async with self.session.get(url) as response:
                 text = await response.text()
-                soup = BeautifulSoup(text, 'html.parser')
                 
                 data = {}
                 # Extract key demographic data
+                if SELECTOLAX_AVAILABLE:
+                    for row in HTMLParser(text).css('table.census-quickfacts-table tr'):
+                        cells = row.css('td')
+                        if len(cells) >= 2:
+                            data[cells[0].text(strip=True)] = cells[1].text(strip=True)
+                    return data
+                    
+                soup = BeautifulSoup(text, 'html.parser')
                 table = soup.find('table', {'class': 'census-quickfacts-table'})
                 if table:
                     for row in table.find_all('tr'):
@@ -121,8 +646,8 @@ class BrunswickDataCollector:
                             
                 return data
                 
-        except Exception as e:
-            self.logger.error(f"Error scraping Census QuickFacts: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error scraping Census QuickFacts: %s", e)
             return {}
             
     async def _scrape_census_reporter(self) -> Dict:
@@ -131,10 +656,18 @@ class BrunswickDataCollector:
         try:
             async with self.session.get(url) as response:
                 text = await response.text()
-                soup = BeautifulSoup(text, 'html.parser')
                 
                 data = {}
                 # Extract detailed demographic data
+                if SELECTOLAX_AVAILABLE:
+                    for stat in HTMLParser(text).css('section#demographics div.stat'):
+                        label = stat.css_first('span.label')
+                        value = stat.css_first('span.value')
+                        if label and value:
+                            data[label.text(strip=True)] = value.text(strip=True)
+                    return data
+                    
+                soup = BeautifulSoup(text, 'html.parser')
                 demographics = soup.find('section', {'id': 'demographics'})
                 if demographics:
                     for stat in demographics.find_all('div', {'class': 'stat'}):
@@ -145,8 +678,8 @@ class BrunswickDataCollector:
                             
                 return data
                 
-        except Exception as e:
-            self.logger.error(f"Error scraping Census Reporter: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error scraping Census Reporter: %s", e)
             return {}
             
     async def _scrape_town_demographics(self) -> Dict:
@@ -165,8 +698,8 @@ class BrunswickDataCollector:
                 }
                 return data
                 
-        except Exception as e:
-            self.logger.error(f"Error scraping town demographics: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error scraping town demographics: %s", e)
             return {}
             
     async def _scrape_epa_superfund(self) -> Dict:
@@ -192,40 +725,30 @@ class BrunswickDataCollector:
                     
                 return data
                 
-        except Exception as e:
-            self.logger.error(f"Error scraping EPA Superfund: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error scraping EPA Superfund: %s", e)
             return {}
             
     async def _scrape_fema_flood(self) -> Dict:
         """Scrape FEMA flood map data"""
         url = self.urls.get('fema_flood')
-        try:
-            # Note: FEMA might require specific API access or different approach
-            data = {
-                'source': 'FEMA Flood Map Service Center',
-                'location': 'Brunswick, ME',
-                'timestamp': datetime.utcnow().isoformat()
-            }
-            return data
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping FEMA flood data: {str(e)}")
-            return {}
+        # Note: FEMA might require specific API access or different approach
+        data = {
+            'source': 'FEMA Flood Map Service Center',
+            'location': 'Brunswick, ME',
+            'timestamp': datetime.utcnow().isoformat()
+        }
+        return data
             
     async def _scrape_nces_data(self) -> Dict:
         """Scrape NCES education data"""
-        try:
-            # NCES data might require specific API access
-            data = {
-                'source': 'National Center for Education Statistics',
-                'location': 'Brunswick, ME',
-                'timestamp': datetime.utcnow().isoformat()
-            }
-            return data
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping NCES data: {str(e)}")
-            return {}
+        # NCES data might require specific API access
+        data = {
+            'source': 'National Center for Education Statistics',
+            'location': 'Brunswick, ME',
+            'timestamp': datetime.utcnow().isoformat()
+        }
+        return data
             
     async def _scrape_maine_doe(self) -> Dict:
         """Scrape Maine DOE data"""
@@ -244,10 +767,99 @@ class BrunswickDataCollector:
                 
                 return data
                 
-        except Exception as e:
-            self.logger.error(f"Error scraping Maine DOE data: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error scraping Maine DOE data: %s", e)
             return {}
             
+    def _parse_assessment_row(self, cells: List[str], year: int) -> Optional[Tuple]:
+        """
+        Parse assessment data from the stripped cell texts of a table row
+        into a tuple ordered like _ASSESSMENT_COLUMNS
+        """
+        try:
+            if len(cells) < 6:
+                return None
+                
+            parse_currency = self._parse_currency
+            return (
+                cells[0],
+                cells[1],
+                cells[2],
+                parse_currency(cells[3]),
+                parse_currency(cells[4]),
+                parse_currency(cells[5]),
+                year
+            )
+            
+        except (IndexError, AttributeError, ValueError) as e:
+            self.logger.error("Error parsing assessment row: %s", e)
+            return None
+            
+    def _parse_permit_data(self, data: Dict) -> List[Dict]:
+        """Parse permit data from API response"""
+        try:
+            permits = []
+            for item in data.get('permits', []):
+                permit = dict(zip(_PERMIT_FIELDS, _extract(item, _PERMIT_GETTER, _PERMIT_KEYS)))
+                permit['estimated_cost'] = self._parse_currency(permit['estimated_cost'])
+                permits.append(permit)
+            return permits
+            
+        except (AttributeError, TypeError) as e:
+            self.logger.error("Error parsing permit data: %s", e)
+            return []
+            
+    def _parse_violation_data(self, data: Dict) -> List[Dict]:
+        """Parse code violation data"""
+        try:
+            violations = [
+                dict(zip(_VIOLATION_FIELDS, _extract(item, _VIOLATION_GETTER, _VIOLATION_KEYS)))
+                for item in data.get('violations', [])
+            ]
+            return violations
+            
+        except (AttributeError, TypeError) as e:
+            self.logger.error("Error parsing violation data: %s", e)
+            return []
+            
+    def _parse_records(self, data, key: str) -> List[Dict]:
+        """
+        Return the raw records from an API response that has no dedicated
+        field mapping, either a bare list or a list under the given key
+        """
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            return data.get(key, [])
+        self.logger.error("Unexpected %s response type: %s", key, type(data).__name__)
+        return []
+            
+    def _parse_currency(self, value: str) -> float:
+        """Parse currency string to float"""
+        if not value:
+            return 0.0
+        if isinstance(value, (int, float)):
+            return float(value)
+        try:
+            return float(_CURRENCY_RE.sub('', value))
+        except (TypeError, ValueError):
+            return 0.0
+            
+    def _drop_failures(self, category: str, results: List) -> List:
+        """
+        Replace expected scrape failures returned by asyncio.gather with empty
+        results; anything else is a bug and is re-raised
+        """
+        cleaned = []
+        for result in results:
+            if isinstance(result, BaseException):
+                if not isinstance(result, SCRAPE_ERRORS):
+                    raise result
+                self.logger.error("Error scraping %s source: %s", category, result)
+                result = {}
+            cleaned.append(result)
+        return cleaned
+        
     def _combine_demographic_data(self, *data_sources) -> Dict:
         """Combine and normalize demographic data from multiple sources"""
         combined = {
@@ -1,20 +1,77 @@
 """
 Brunswick-specific GIS patterns and collectors
 """
+import asyncio
+import json
 import logging
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Tuple
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from .gis_formats import GISFormatHandler
 
+# orjson decodes large layer responses considerably faster than the stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# pyarrow is optional; it is only needed for columnar (as_arrow) output
+PYARROW_AVAILABLE = False
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pass
+
+# Features requested per ArcGIS query page
+PAGE_SIZE = 2000
+
+# Layer queries allowed in flight at once by acollect
+MAX_CONCURRENT_LAYERS = 4
+
+@lru_cache(maxsize=None)
+def _shared_format_handler() -> GISFormatHandler:
+    """GISFormatHandler holds no per-collector state, so share one instance"""
+    return GISFormatHandler()
+
+# ArcGIS field names that map to our standard names; other fields are lower-cased
+_STANDARD_FIELDS = MappingProxyType({
+    'PARCEL_ID': 'parcel_id',
+    'ADDRESS': 'address',
+    'OWNER_NAME': 'owner_name',
+    'LAND_VALUE': 'land_value',
+    'BUILDING_VALUE': 'building_value',
+    'TOTAL_VALUE': 'total_value',
+    'ZONE_NAME': 'zone_name',
+    'PERMITTED_USES': 'permitted_uses',
+    'FLD_ZONE': 'flood_zone',
+    'STATIC_BFE': 'base_flood_elevation',
+    'UTILITY_TYPE': 'utility_type',
+    'LU_CODE': 'land_use_code',
+    'LU_DESC': 'land_use_description'
+})
+
 class BrunswickGISCollector:
+    # Layers whose consumers only use attributes, so geometry is never requested
+    ATTRIBUTE_ONLY_LAYERS = frozenset({'utilities', 'land_use'})
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.format_handler = GISFormatHandler()
+        self.format_handler = _shared_format_handler()
         
         # Brunswick-specific GIS endpoints
         self.base_url = "https://gis.brunswickme.org/arcgis/rest/services"
         
+        # Connect/read timeouts for every request
+        self.timeout = (3, 30)
+        self.session = self._create_session()
+        
         # Layer IDs and names
         self.layers = {
             "parcels": {
@@ -50,12 +107,53 @@ class BrunswickGISCollector:
             }
         }
         
-    def collect(self, layer_types: List[str] = None) -> Dict:
+        # Resolve each layer's query URL, outFields and (source, standard)
+        # field-name pairs once, then freeze the layer definitions
+        for layer_type, layer_info in self.layers.items():
+            layer_info['query_url'] = f"{self.base_url}/{layer_info['id']}/query"
+            layer_info['out_fields'] = ','.join(layer_info['fields'])
+            layer_info['_std_fields'] = tuple(
+                (field, _STANDARD_FIELDS.get(field, field.lower()))
+                for field in layer_info['fields']
+            )
+            self.layers[layer_type] = MappingProxyType(layer_info)
+        
+    def _create_session(self) -> requests.Session:
+        """Create a pooled requests session with retry configuration"""
+        session = requests.Session()
+        
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry_strategy)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+        
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        
+    def collect(self, layer_types: List[str] = None, as_arrow: bool = False,
+                include_geometry: bool = True) -> Dict:
         """
         Collect GIS data for Brunswick
         
         Args:
             layer_types: Types of layers to collect, or None for all
+            as_arrow: Return each layer as a columnar pyarrow Table instead
+                of a list of GeoJSON features
+            include_geometry: Request feature geometry; pass False when only
+                attributes are needed to skip the coordinate payload
         """
         try:
             self.logger.info("Collecting Brunswick GIS data")
@@ -70,16 +168,28 @@ class BrunswickGISCollector:
                 layer_types = list(self.layers.keys())
             
             collected_data = {}
+            layer_types = [layer_type for layer_type in layer_types if layer_type in self.layers]
             
-            for layer_type in layer_types:
-                if layer_type not in self.layers:
-                    continue
-                    
-                layer_info = self.layers[layer_type]
-                layer_data = self._collect_layer(layer_info)
-                
-                if layer_data:
-                    collected_data[layer_type] = layer_data
+            # Layers are independent queries, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=max(len(layer_types), 1)) as executor:
+                futures = {
+                    layer_type: executor.submit(
+                        self._collect_layer,
+                        self.layers[layer_type],
+                        self._wants_geometry(layer_type, include_geometry)
+                    )
+                    for layer_type in layer_types
+                }
+                for layer_type, future in futures.items():
+                    layer_data = future.result()
+                    if layer_data:
+                        collected_data[layer_type] = layer_data
+            
+            if as_arrow:
+                collected_data = {
+                    layer_type: self.to_arrow(features)
+                    for layer_type, features in collected_data.items()
+                }
             
             return {
                 'success': True,
@@ -88,94 +198,187 @@ class BrunswickGISCollector:
             }
             
         except Exception as e:
-            self.logger.error(f"Error collecting Brunswick GIS data: {str(e)}")
+            self.logger.error("Error collecting Brunswick GIS data: %s", e)
             return {
                 'success': False,
                 'error': str(e),
                 'metadata': metadata
             }
     
-    def _collect_layer(self, layer_info: Dict) -> List[Dict]:
-        """Collect data for a specific layer"""
+    async def acollect(self, layer_types: List[str] = None, as_arrow: bool = False,
+                       include_geometry: bool = True) -> Dict:
+        """
+        Collect GIS data for Brunswick using aiohttp, querying layers
+        concurrently with at most MAX_CONCURRENT_LAYERS in flight
+        
+        Args:
+            layer_types: Types of layers to collect, or None for all
+            as_arrow: Return each layer as a columnar pyarrow Table instead
+                of a list of GeoJSON features
+            include_geometry: Request feature geometry; pass False when only
+                attributes are needed to skip the coordinate payload
+        """
+        metadata = {
+            'collection_date': datetime.now().isoformat(),
+            'layer_types': layer_types
+        }
+        
         try:
-            url = f"{self.base_url}/{layer_info['id']}"
-            
-            # Build query parameters
-            params = {
-                'f': 'json',
-                'where': '1=1',
-                'outFields': ','.join(layer_info['fields']),
-                'returnGeometry': 'true',
-                'geometryPrecision': 6,
-                'outSR': '4326'  # Return in WGS84
-            }
+            self.logger.info("Collecting Brunswick GIS data")
             
-            # Make request
-            response = requests.get(url + "/query", params=params)
-            data = response.json()
+            # If no specific types requested, collect all
+            if not layer_types:
+                layer_types = list(self.layers.keys())
+            layer_types = [layer_type for layer_type in layer_types if layer_type in self.layers]
             
-            # Process response
-            features = []
-            for feature in data.get('features', []):
-                processed_feature = self._process_feature(feature, layer_info)
-                if processed_feature:
-                    features.append(processed_feature)
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_LAYERS)
             
-            return features
+            async def bounded(session, layer_info, geometry):
+                async with semaphore:
+                    return await self._acollect_layer(session, layer_info, geometry)
             
-        except Exception as e:
-            self.logger.error(f"Error collecting layer: {str(e)}")
-            return []
-    
-    def _process_feature(self, feature: Dict, layer_info: Dict) -> Dict:
-        """Process a feature from Brunswick's GIS"""
-        try:
-            # Extract attributes
-            attributes = feature.get('attributes', {})
+            connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_LAYERS)
+            timeout = aiohttp.ClientTimeout(sock_connect=self.timeout[0], sock_read=self.timeout[1])
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                async with asyncio.TaskGroup() as group:
+                    tasks = {
+                        layer_type: group.create_task(bounded(
+                            session,
+                            self.layers[layer_type],
+                            self._wants_geometry(layer_type, include_geometry)
+                        ))
+                        for layer_type in layer_types
+                    }
             
-            # Convert field names to our standard format
-            properties = self._standardize_fields(attributes, layer_info['fields'])
+            collected_data = {
+                layer_type: task.result()
+                for layer_type, task in tasks.items()
+                if task.result()
+            }
             
-            # Extract geometry
-            geometry = feature.get('geometry', {})
+            if as_arrow:
+                collected_data = {
+                    layer_type: self.to_arrow(features)
+                    for layer_type, features in collected_data.items()
+                }
             
             return {
-                'type': 'Feature',
-                'geometry': geometry,
-                'properties': properties
+                'success': True,
+                'data': collected_data,
+                'metadata': metadata
             }
             
         except Exception as e:
-            self.logger.error(f"Error processing feature: {str(e)}")
-            return None
+            self.logger.error("Error collecting Brunswick GIS data: %s", e)
+            return {
+                'success': False,
+                'error': str(e),
+                'metadata': metadata
+            }
     
-    def _standardize_fields(self, attributes: Dict, fields: List[str]) -> Dict:
-        """Standardize field names to match our system"""
+    @staticmethod
+    def to_arrow(features: List[Dict]) -> "pa.Table":
+        """
+        Convert GeoJSON features into a pyarrow Table with one column per
+        property plus the geometry serialized as GeoJSON text
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for columnar output. Install with: pip install pyarrow")
+        return pa.Table.from_pylist([
+            {**feature['properties'], 'geometry': json.dumps(feature.get('geometry'))}
+            for feature in features
+        ])
+    
+    def _wants_geometry(self, layer_type: str, include_geometry: bool) -> bool:
+        return include_geometry and layer_type not in self.ATTRIBUTE_ONLY_LAYERS
+    
+    def _collect_layer(self, layer_info: Dict, include_geometry: bool = True) -> List[Dict]:
+        """Collect data for a specific layer"""
         try:
-            standard_fields = {
-                'PARCEL_ID': 'parcel_id',
-                'ADDRESS': 'address',
-                'OWNER_NAME': 'owner_name',
-                'LAND_VALUE': 'land_value',
-                'BUILDING_VALUE': 'building_value',
-                'TOTAL_VALUE': 'total_value',
-                'ZONE_NAME': 'zone_name',
-                'PERMITTED_USES': 'permitted_uses',
-                'FLD_ZONE': 'flood_zone',
-                'STATIC_BFE': 'base_flood_elevation',
-                'UTILITY_TYPE': 'utility_type',
-                'LU_CODE': 'land_use_code',
-                'LU_DESC': 'land_use_description'
-            }
+            return list(self._iter_layer_features(layer_info, include_geometry))
             
-            result = {}
-            for field in fields:
-                if field in attributes:
-                    standard_name = standard_fields.get(field, field.lower())
-                    result[standard_name] = attributes[field]
+        except (requests.RequestException, ValueError) as e:
+            self.logger.error("Error collecting layer: %s", e)
+            return []
+    
+    def _iter_layer_features(self, layer_info: Dict, include_geometry: bool = True) -> Iterator[Dict]:
+        """Yield a layer's features one ArcGIS result page at a time"""
+        params = self._query_params(layer_info, include_geometry)
+        
+        offset = 0
+        while True:
+            params['resultOffset'] = offset
+            response = self.session.get(layer_info['query_url'], params=params, timeout=self.timeout)
+            features, has_more = self._process_page(json_loads(response.content), layer_info)
+            yield from features
             
-            return result
+            if not has_more:
+                break
+            # Servers may cap pages below PAGE_SIZE (maxRecordCount), so
+            # advance by what actually came back
+            offset += len(features)
+    
+    async def _acollect_layer(self, session: aiohttp.ClientSession, layer_info: Dict,
+                              include_geometry: bool = True) -> List[Dict]:
+        """Collect data for a specific layer over an aiohttp session"""
+        try:
+            params = self._query_params(layer_info, include_geometry)
             
-        except Exception as e:
-            self.logger.error(f"Error standardizing fields: {str(e)}")
-            return {}
+            features = []
+            offset = 0
+            while True:
+                params['resultOffset'] = offset
+                async with session.get(layer_info['query_url'], params=params) as response:
+                    data = json_loads(await response.read())
+                page, has_more = self._process_page(data, layer_info)
+                features.extend(page)
+                
+                if not has_more:
+                    return features
+                offset += len(page)
+                
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.logger.error("Error collecting layer: %s", e)
+            return []
+    
+    def _query_params(self, layer_info: Dict, include_geometry: bool = True) -> Dict:
+        """Build the paged ArcGIS query parameters for a layer"""
+        # ArcGIS returns GeoJSON Features directly
+        return {
+            'f': 'geojson',
+            'where': '1=1',
+            'outFields': layer_info['out_fields'],
+            'returnGeometry': 'true' if include_geometry else 'false',
+            'geometryPrecision': 6,
+            'outSR': '4326',  # Return in WGS84
+            'resultRecordCount': PAGE_SIZE
+        }
+    
+    def _process_page(self, data: Dict, layer_info: Dict) -> Tuple[List[Dict], bool]:
+        """
+        Standardize one page of GeoJSON features
+        
+        Returns:
+            The page's features and whether more pages remain
+        """
+        # Features are already GeoJSON; only the property names need rewriting
+        features = data.get('features', [])
+        for feature in features:
+            feature['properties'] = self._standardize_fields(
+                feature.get('properties') or {}, layer_info['_std_fields']
+            )
+        
+        # Keep paging while the server says the limit was hit, which it may
+        # cap below PAGE_SIZE; an empty page always ends the layer. GeoJSON
+        # output reports the flag under 'properties' on some servers
+        exceeded = data.get('exceededTransferLimit') or \
+            (data.get('properties') or {}).get('exceededTransferLimit')
+        return features, bool(exceeded) and len(features) > 0
+    
+    def _standardize_fields(self, attributes: Dict, std_fields: Tuple[Tuple[str, str], ...]) -> Dict:
+        """Standardize field names to match our system"""
+        return {
+            standard_name: attributes[field]
+            for field, standard_name in std_fields
+            if field in attributes
+        }
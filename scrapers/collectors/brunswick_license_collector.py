@@ -4,19 +4,234 @@ Collector for Brunswick business licenses and additional property details
 import aiohttp
 import asyncio
 from bs4 import BeautifulSoup
+import soupsieve as sv
+import hashlib
 import logging
-from typing import Dict, List, Optional
-import re
+import os
+from functools import lru_cache
+import tempfile
+import time
+from typing import Dict, List, Optional, Union
 from datetime import datetime
-import json
 from pathlib import Path
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Prefer the C-backed lxml parser; html.parser is the pure-Python fallback
+HTML_PARSER = 'html.parser'
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    logging.warning("lxml not available, falling back to html.parser. Install with: pip install lxml")
+
+# selectolax's Lexbor parser evaluates the CSS selectors below in C
+SELECTOLAX_AVAILABLE = False
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    logging.warning("selectolax not available, falling back to BeautifulSoup. Install with: pip install selectolax")
+
+def make_shared_session() -> aiohttp.ClientSession:
+    """
+    Create a pooled session to pass to several Brunswick collectors so
+    requests to the same hosts reuse keep-alive connections. Call from
+    within the event loop; the caller is responsible for closing it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+        keepalive_timeout=60
+    )
+    # Large PDFs need the generous read timeout; connects should fail fast
+    timeout = aiohttp.ClientTimeout(total=120, sock_connect=10, sock_read=30)
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={'Accept-Encoding': 'gzip, deflate'}
+    )
+
+# Statuses worth retrying; anything else non-200 is treated as no data
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# What a fetch-and-parse can legitimately raise once retries are exhausted:
+# network failures, timeouts and undecodable bodies. Anything else is a bug
+FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+
+async def fetch_with_retry(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    text: bool = False,
+    max_retries: int = 3,
+    backoff_factor: float = 0.5,
+    dest: Optional[Path] = None
+) -> Optional[Union[str, bytes, Path]]:
+    """
+    GET a URL while holding semaphore, retrying connection errors, 429s and
+    5xx responses with exponential backoff (or the server's Retry-After)
+    
+    Args:
+        dest: Stream the body into this file instead of buffering it
+    
+    Returns:
+        Response body (or dest) on 200, None for any other status
+    """
+    for attempt in range(max_retries + 1):
+        delay = backoff_factor * (2 ** attempt)
+        try:
+            async with semaphore:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        if dest is not None:
+                            await _stream_to_file(response, dest)
+                            return dest
+                        return await response.text() if text else await response.read()
+                    if response.status not in RETRY_STATUSES:
+                        return None
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = max(delay, int(retry_after))
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == max_retries:
+                raise
+        if attempt < max_retries:
+            await asyncio.sleep(delay)
+    return None
+
+async def _stream_to_file(response: aiohttp.ClientResponse, dest: Path) -> None:
+    """Drain a response body into dest in chunks, replacing it atomically"""
+    # Disk work runs in threads, as in cached_fetch, so it never stalls the event loop
+    await asyncio.to_thread(dest.parent.mkdir, parents=True, exist_ok=True)
+    tmp = await asyncio.to_thread(tempfile.NamedTemporaryFile, dir=dest.parent, suffix='.tmp', delete=False)
+    try:
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                await asyncio.to_thread(tmp.write, chunk)
+        finally:
+            await asyncio.to_thread(tmp.close)
+        await asyncio.to_thread(os.replace, tmp.name, dest)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+# Fetched page and PDF bodies are reused from disk for a day
+CACHE_TTL = 86400
+
+# Large bodies (PDFs) are written to disk in chunks of this size
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def cache_path(cache_dir: str, url: str, suffix: str = '.bin') -> Path:
+    """Content-addressed cache file for a URL"""
+    digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return Path(cache_dir) / digest[:2] / f"{digest}{suffix}"
+
+def is_fresh(path: Path, ttl: int = CACHE_TTL) -> bool:
+    """Whether a cache file exists and is younger than ttl"""
+    try:
+        return time.time() - path.stat().st_mtime < ttl
+    except OSError:
+        return False
+
+def read_cache(path: Path, ttl: int = CACHE_TTL) -> Optional[bytes]:
+    """Cached bytes if the file exists and is younger than ttl, else None"""
+    try:
+        if is_fresh(path, ttl):
+            return path.read_bytes()
+    except OSError:
+        pass
+    return None
+
+def write_cache(path: Path, data: bytes) -> bool:
+    """Write a cache file atomically so readers never see a partial body"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A uniquely named temp file per write: concurrent misses on one URL
+        # run in separate threads of the same process
+        tmp = tempfile.NamedTemporaryFile(dir=path.parent, suffix='.tmp', delete=False)
+        try:
+            with tmp:
+                tmp.write(data)
+            os.replace(tmp.name, path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+        return True
+    except OSError as e:
+        logging.getLogger(__name__).warning("Could not write cache file %s: %s", path, e)
+        return False
+
+async def cached_fetch(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    cache_dir: str,
+    url: str,
+    ttl: int = CACHE_TTL
+) -> Optional[bytes]:
+    """Body of url from the disk cache, fetching and storing it on a miss"""
+    path = cache_path(cache_dir, url)
+    body = await asyncio.to_thread(read_cache, path, ttl)
+    if body is None:
+        body = await fetch_with_retry(session, semaphore, url)
+        if body is not None:
+            await asyncio.to_thread(write_cache, path, body)
+    return body
+
+async def cached_fetch_path(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    cache_dir: str,
+    url: str,
+    ttl: int = CACHE_TTL
+) -> Optional[Path]:
+    """Cache file holding url's body, streaming it to disk on a miss"""
+    path = cache_path(cache_dir, url)
+    if await asyncio.to_thread(is_fresh, path, ttl):
+        return path
+    return await fetch_with_retry(session, semaphore, url, dest=path)
+
+@lru_cache(maxsize=None)
+def _compiled_selector(selector: str) -> sv.SoupSieve:
+    """soupsieve selector for the BeautifulSoup fallback, compiled once"""
+    return sv.compile(selector)
+
 class BrunswickLicenseCollector:
-    def __init__(self, config: Dict):
+    # Class-substring selectors for the blocks scraped below; built once
+    # rather than as per-call class regexes
+    _LICENSE_SELECTOR = 'div[class*="license"]'
+    _VIOLATION_SELECTOR = 'div[class*="violation"]'
+    _BUSINESS_RECORD_SELECTOR = 'div[class*="business-record"]'
+    _ASSESSMENT_HISTORY_SELECTOR = 'table[class*="assessment-history"]'
+    _PROPERTY_FEATURES_SELECTOR = 'div[class*="property-features"]'
+    
+    # Property feature class name -> (section, field) in the features dict
+    _FEATURE_FIELDS = {
+        'year-built': ('building', 'year_built'),
+        'square-feet': ('building', 'square_feet'),
+        'bedrooms': ('building', 'bedrooms'),
+        'bathrooms': ('building', 'bathrooms'),
+        'acreage': ('land', 'acreage'),
+        'zoning': ('land', 'zoning'),
+        'frontage': ('land', 'frontage')
+    }
+    
+    def __init__(self, config: Dict, session: Optional[aiohttp.ClientSession] = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.cache_dir = config.get('cache_dir', 'cache')
-        self.session = None
+        
+        # An injected session (see make_shared_session) stays open on exit
+        self.session = session
+        self._owns_session = session is None
+        
+        # Cap in-flight requests so fan-outs don't trip rate limits
+        self._sem = asyncio.Semaphore(config.get('max_concurrency', 10))
         
         # Source URLs
         self.urls = {
@@ -34,42 +249,55 @@ class BrunswickLicenseCollector:
         }
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = make_shared_session()
+            self._owns_session = True
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
             
     async def get_business_licenses(self, business_name: Optional[str] = None) -> List[Dict]:
         """Get business license information"""
         licenses = []
+        clerk_task = None
         try:
+            # The clerk page is independent of the licenses page; start it now
+            if business_name:
+                clerk_task = asyncio.create_task(self._get_clerk_records(business_name))
+                
             # Scrape license types and requirements
-            async with self.session.get(self.urls['licenses']['main']) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+            html = await self._get(self.urls['licenses']['main'], text=True)
+            if html:
+                tree = self._parse_html(html)
+                
+                # Extract license information
+                license_divs = self._css(tree, self._LICENSE_SELECTOR)
+                for div in license_divs:
+                    license_info = {
+                        'type': self._safe_extract(div, '.license-type'),
+                        'requirements': self._safe_extract(div, '.requirements'),
+                        'fee': self._safe_extract(div, '.fee'),
+                        'duration': self._safe_extract(div, '.duration')
+                    }
+                    licenses.append(license_info)
                     
-                    # Extract license information
-                    license_divs = soup.find_all('div', class_=re.compile(r'license'))
-                    for div in license_divs:
-                        license_info = {
-                            'type': self._safe_extract(div, '.license-type'),
-                            'requirements': self._safe_extract(div, '.requirements'),
-                            'fee': self._safe_extract(div, '.fee'),
-                            'duration': self._safe_extract(div, '.duration')
-                        }
-                        licenses.append(license_info)
-                        
-            # If business name provided, try to get specific license info
-            if business_name:
-                clerk_licenses = await self._get_clerk_records(business_name)
-                licenses.extend(clerk_licenses)
+            # No license blocks usually means the site layout changed, in
+            # which case the clerk scrape comes back empty as well
+            if not licenses:
+                self.logger.warning("No license information found on the licenses page")
+            elif clerk_task:
+                licenses.extend(await clerk_task)
                 
-        except Exception as e:
+        except FETCH_ERRORS as e:
             self.logger.error(f"Error getting business licenses: {e}")
             
+        finally:
+            if clerk_task and not clerk_task.done():
+                clerk_task.cancel()
+                
         return licenses
         
     async def get_property_history(self, property_id: str) -> Dict:
@@ -82,54 +310,63 @@ class BrunswickLicenseCollector:
         }
         
         try:
-            # Get assessment history
-            async with self.session.get(
-                f"{self.urls['property']['assessment']}/ParcelDetail/{property_id}"
-            ) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extract assessment history
-                    history['assessments'] = self._parse_assessment_history(soup)
-                    
-                    # Extract property features
-                    history['features'] = self._parse_property_features(soup)
-                    
-            # Get ownership history from deeds
-            history['owners'] = await self._get_ownership_history(property_id)
-            
-            # Get environmental data if available
-            history['environmental'] = await self._get_environmental_data(property_id)
+            # The assessment page, deed search and environmental data come
+            # from unrelated backends, so fetch them concurrently
+            tree, owners, environmental = await asyncio.gather(
+                self._fetch_assessment_tree(property_id),
+                self._get_ownership_history(property_id),
+                self._get_environmental_data(property_id),
+                return_exceptions=True
+            )
+            if isinstance(tree, Exception):
+                self.logger.error(f"Error getting assessment page: {tree}")
+            elif tree is not None:
+                # Extract assessment history
+                history['assessments'] = self._parse_assessment_history(tree)
+                
+                # Extract property features
+                history['features'] = self._parse_property_features(tree)
+                
+            if not isinstance(owners, Exception):
+                history['owners'] = owners
+            if not isinstance(environmental, Exception):
+                history['environmental'] = environmental
             
         except Exception as e:
             self.logger.error(f"Error getting property history: {e}")
             
         return history
         
+    async def _fetch_assessment_tree(self, property_id: str):
+        """Fetch and parse a property's ParcelDetail page, or None"""
+        html = await self._get(
+            f"{self.urls['property']['assessment']}/ParcelDetail/{property_id}",
+            text=True
+        )
+        if html:
+            return self._parse_html(html)
+        return None
+        
     async def get_code_violations(self, property_id: str) -> List[Dict]:
         """Get code violation history"""
         violations = []
         try:
-            async with self.session.get(
-                'https://www.brunswickme.gov/150/Code-Enforcement'
-            ) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extract violation information
-                    violation_divs = soup.find_all('div', class_=re.compile(r'violation'))
-                    for div in violation_divs:
-                        violation = {
-                            'date': self._safe_extract(div, '.violation-date'),
-                            'type': self._safe_extract(div, '.violation-type'),
-                            'status': self._safe_extract(div, '.violation-status'),
-                            'resolution': self._safe_extract(div, '.resolution')
-                        }
-                        violations.append(violation)
+            html = await self._get('https://www.brunswickme.gov/150/Code-Enforcement', text=True)
+            if html:
+                tree = self._parse_html(html)
+                
+                # Extract violation information
+                violation_divs = self._css(tree, self._VIOLATION_SELECTOR)
+                for div in violation_divs:
+                    violation = {
+                        'date': self._safe_extract(div, '.violation-date'),
+                        'type': self._safe_extract(div, '.violation-type'),
+                        'status': self._safe_extract(div, '.violation-status'),
+                        'resolution': self._safe_extract(div, '.resolution')
+                    }
+                    violations.append(violation)
                         
-        except Exception as e:
+        except FETCH_ERRORS as e:
             self.logger.error(f"Error getting code violations: {e}")
             
         return violations
@@ -138,24 +375,26 @@ class BrunswickLicenseCollector:
         """Get business records from Town Clerk"""
         records = []
         try:
-            async with self.session.get(self.urls['licenses']['clerk']) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extract business records
-                    record_divs = soup.find_all('div', class_=re.compile(r'business-record'))
-                    for div in record_divs:
-                        if business_name.lower() in div.text.lower():
-                            record = {
-                                'license_number': self._safe_extract(div, '.license-number'),
-                                'issue_date': self._safe_extract(div, '.issue-date'),
-                                'expiration_date': self._safe_extract(div, '.expiration-date'),
-                                'status': self._safe_extract(div, '.status')
-                            }
-                            records.append(record)
+            html = await self._get(self.urls['licenses']['clerk'], text=True)
+            if html:
+                tree = self._parse_html(html)
+                
+                # Extract business records
+                # Lower-case the name once; selectolax joins each div's text
+                # in C, so only the record's own text is lowered per div
+                needle = business_name.lower()
+                record_divs = self._css(tree, self._BUSINESS_RECORD_SELECTOR)
+                for div in record_divs:
+                    if needle in self._node_text(div).lower():
+                        record = {
+                            'license_number': self._safe_extract(div, '.license-number'),
+                            'issue_date': self._safe_extract(div, '.issue-date'),
+                            'expiration_date': self._safe_extract(div, '.expiration-date'),
+                            'status': self._safe_extract(div, '.status')
+                        }
+                        records.append(record)
                             
-        except Exception as e:
+        except FETCH_ERRORS as e:
             self.logger.error(f"Error getting clerk records: {e}")
             
         return records
@@ -165,21 +404,19 @@ class BrunswickLicenseCollector:
         owners = []
         try:
             # Note: This might require authentication or direct API access
-            async with self.session.get(
-                f"{self.urls['property']['deeds']}/search/{property_id}"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    for record in data.get('records', []):
-                        owner = {
-                            'name': record.get('grantor'),
-                            'transfer_date': record.get('date'),
-                            'deed_type': record.get('type'),
-                            'book_page': f"{record.get('book')}/{record.get('page')}"
-                        }
-                        owners.append(owner)
+            body = await self._get(f"{self.urls['property']['deeds']}/search/{property_id}")
+            if body:
+                data = json_loads(body)
+                for record in data.get('records', []):
+                    owner = {
+                        'name': record.get('grantor'),
+                        'transfer_date': record.get('date'),
+                        'deed_type': record.get('type'),
+                        'book_page': f"{record.get('book')}/{record.get('page')}"
+                    }
+                    owners.append(owner)
                         
-        except Exception as e:
+        except FETCH_ERRORS as e:
             self.logger.error(f"Error getting ownership history: {e}")
             
         return owners
@@ -198,20 +435,20 @@ class BrunswickLicenseCollector:
             self.logger.error(f"Error getting environmental data: {e}")
             return None
             
-    def _parse_assessment_history(self, soup: BeautifulSoup) -> List[Dict]:
+    def _parse_assessment_history(self, tree) -> List[Dict]:
         """Parse assessment history from property page"""
         history = []
         try:
-            assessment_table = soup.find('table', class_=re.compile(r'assessment-history'))
-            if assessment_table:
-                rows = assessment_table.find_all('tr')
+            assessment_table = self._css_first(tree, self._ASSESSMENT_HISTORY_SELECTOR)
+            if assessment_table is not None:
+                rows = self._css(assessment_table, 'tr')
                 for row in rows[1:]:  # Skip header
-                    cells = row.find_all('td')
+                    cells = self._css(row, 'td')
                     if len(cells) >= 3:
                         assessment = {
-                            'year': cells[0].text.strip(),
-                            'value': cells[1].text.strip(),
-                            'reason': cells[2].text.strip()
+                            'year': self._node_text(cells[0], strip=True),
+                            'value': self._node_text(cells[1], strip=True),
+                            'reason': self._node_text(cells[2], strip=True)
                         }
                         history.append(assessment)
         except Exception as e:
@@ -219,45 +456,84 @@ class BrunswickLicenseCollector:
             
         return history
         
-    def _parse_property_features(self, soup: BeautifulSoup) -> Dict:
+    def _parse_property_features(self, tree) -> Dict:
         """Parse detailed property features"""
         features = {}
         try:
-            feature_div = soup.find('div', class_=re.compile(r'property-features'))
-            if feature_div:
-                # Extract building information
-                features['building'] = {
-                    'year_built': self._safe_extract(feature_div, '.year-built'),
-                    'square_feet': self._safe_extract(feature_div, '.square-feet'),
-                    'bedrooms': self._safe_extract(feature_div, '.bedrooms'),
-                    'bathrooms': self._safe_extract(feature_div, '.bathrooms')
-                }
-                
-                # Extract land information
-                features['land'] = {
-                    'acreage': self._safe_extract(feature_div, '.acreage'),
-                    'zoning': self._safe_extract(feature_div, '.zoning'),
-                    'frontage': self._safe_extract(feature_div, '.frontage')
-                }
+            feature_div = self._css_first(tree, self._PROPERTY_FEATURES_SELECTOR)
+            if feature_div is not None:
+                # Building and land information, every field defaulting to None
+                features['building'] = {}
+                features['land'] = {}
+                for section, field in self._FEATURE_FIELDS.values():
+                    features[section][field] = None
+                    
+                # One pass over the classed descendants instead of a
+                # separate selector walk per field; first match wins
+                for node in self._css(feature_div, '[class]'):
+                    for class_name in self._node_classes(node):
+                        target = self._FEATURE_FIELDS.get(class_name)
+                        if target and features[target[0]][target[1]] is None:
+                            features[target[0]][target[1]] = self._node_text(node, strip=True)
                 
         except Exception as e:
             self.logger.error(f"Error parsing property features: {e}")
             
         return features
         
+    async def _get(self, url: str, text: bool = False) -> Optional[Union[str, bytes]]:
+        """Cached, rate-limited GET with retries; returns the body or None"""
+        body = await cached_fetch(self.session, self._sem, self.cache_dir, url)
+        if body is not None and text:
+            return body.decode('utf-8', errors='replace')
+        return body
+        
+    def _parse_html(self, html: str):
+        """Parse HTML with selectolax when available, BeautifulSoup otherwise"""
+        if SELECTOLAX_AVAILABLE:
+            return LexborHTMLParser(html)
+        return BeautifulSoup(html, HTML_PARSER)
+        
+    @staticmethod
+    def _css(element, selector: str) -> List:
+        """All nodes under element matching a CSS selector"""
+        if SELECTOLAX_AVAILABLE:
+            return element.css(selector)
+        return _compiled_selector(selector).select(element)
+        
+    @staticmethod
+    def _css_first(element, selector: str):
+        """First node under element matching a CSS selector, or None"""
+        if SELECTOLAX_AVAILABLE:
+            return element.css_first(selector)
+        return _compiled_selector(selector).select_one(element)
+        
+    @staticmethod
+    def _node_text(node, strip: bool = False) -> str:
+        """Text content of a selectolax or BeautifulSoup node"""
+        if SELECTOLAX_AVAILABLE:
+            return node.text(strip=strip)
+        return node.get_text(strip=strip)
+        
+    @staticmethod
+    def _node_classes(node) -> List[str]:
+        """Class names of a selectolax or BeautifulSoup node"""
+        if SELECTOLAX_AVAILABLE:
+            return (node.attributes.get('class') or '').split()
+        return node.get('class') or []
+        
     def _safe_extract(
         self,
-        element: BeautifulSoup,
+        element,
         selector: str,
         attribute: Optional[str] = None
     ) -> Optional[str]:
-        """Safely extract text or attribute from element"""
-        try:
-            found = element.select_one(selector)
-            if found:
-                if attribute:
-                    return found.get(attribute)
-                return found.get_text(strip=True)
-        except Exception:
-            pass
-        return None
+        """Extract text or attribute from the first match under element, or None"""
+        found = self._css_first(element, selector)
+        if found is None:
+            return None
+        if attribute:
+            if SELECTOLAX_AVAILABLE:
+                return found.attributes.get(attribute)
+            return found.get(attribute)
+        return self._node_text(found, strip=True)
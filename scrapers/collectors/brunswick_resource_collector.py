@@ -5,19 +5,75 @@ import aiohttp
 import asyncio
 from bs4 import BeautifulSoup
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 import pandas as pd
-import PyPDF2
-import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+from .brunswick_license_collector import (
+    FETCH_ERRORS, cache_path, cached_fetch, cached_fetch_path, make_shared_session,
+    read_cache, write_cache
+)
+
+# Prefer the C-backed lxml parser; html.parser is the pure-Python fallback
+HTML_PARSER = 'html.parser'
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    logging.warning("lxml not available, falling back to html.parser. Install with: pip install lxml")
+
+# pypdfium2 binds PDFium's C++ text extraction; PyPDF2 is the pure-Python fallback
+PDFIUM_AVAILABLE = False
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    import PyPDF2
+    logging.warning("pypdfium2 not available, falling back to PyPDF2. Install with: pip install pypdfium2")
+
+# Tax maps are numbered 1 through TAX_MAP_COUNT
+TAX_MAP_COUNT = 29
+
+# Deletes currency symbols and thousands separators in one pass
+_CURRENCY_STRIP = str.maketrans('', '', '$,')
+
+def _sync_extract_pdf_text(pdf_path: str) -> str:
+    """Extract the text of every page; runs in a worker process"""
+    if PDFIUM_AVAILABLE:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            pages = []
+            for page in pdf:
+                text_page = page.get_textpage()
+                pages.append(text_page.get_text_range())
+                text_page.close()
+                page.close()
+            return "\n".join(pages)
+        finally:
+            pdf.close()
+            
+    reader = PyPDF2.PdfReader(pdf_path)
+    return "\n".join(page.extract_text() for page in reader.pages)
+
 class BrunswickResourceCollector:
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, session: Optional[aiohttp.ClientSession] = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.cache_dir = config.get('cache_dir', 'cache')
-        self.session = None
+        
+        # An injected session (see brunswick_license_collector.make_shared_session)
+        # stays open on exit
+        self.session = session
+        self._owns_session = session is None
+        
+        # Cap in-flight requests so tax map fan-outs don't trip rate limits
+        self._sem = asyncio.Semaphore(config.get('max_concurrency', 10))
+        
+        # PDF text extraction is CPU-bound; run it off the event loop
+        self._pdf_executor = None
         
         # Core resource URLs
         self.urls = {
@@ -26,14 +82,14 @@ class BrunswickResourceCollector:
                 'personal_property': 'https://www.brunswickme.gov/DocumentCenter/View/9923/2024-Personal-Property-Commitment-Book'
             },
             'tax_maps': {
-                'index': 'https://www.brunswickme.gov/DocumentCenter/View/1259/Index-Map',
-                'maps': [f'https://www.brunswickme.gov/DocumentCenter/View/{1259 + i}/Map-{i}' for i in range(1, 30)]
+                'index': 'https://www.brunswickme.gov/DocumentCenter/View/1259/Index-Map'
             },
             'property_search': {
                 'cards': 'https://gis.vgsi.com/brunswickme/Default.aspx',
                 'deeds': 'https://i2k.uslandrecords.com/ME/Cumberland/D/Default.aspx',
                 'gis': 'https://experience.arcgis.com/experience/d25390b67f374b7986ccabb1554ecfca'
             },
+            # Both sales books are currently published on the Revaluation page
             'sales_books': {
                 '2023_2024': 'https://www.brunswickme.gov/581/Revaluation',
                 '2024_2025': 'https://www.brunswickme.gov/581/Revaluation'
@@ -56,13 +112,27 @@ class BrunswickResourceCollector:
             }
         }
         
+        # Tax bill URLs keyed by (bill_type, year) for single-lookup dispatch
+        self._tax_bill_index = {
+            (bill_type, int(year)): url
+            for bill_type, years in self.urls['tax_bills'].items()
+            for year, url in years.items()
+        }
+        
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = make_shared_session()
+            self._owns_session = True
+        self._pdf_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._pdf_executor:
+            self._pdf_executor.shutdown(wait=False, cancel_futures=True)
+            self._pdf_executor = None
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
             
     async def get_commitment_data(self, year: int = 2024) -> Dict:
         """Get data from commitment books"""
@@ -72,18 +142,16 @@ class BrunswickResourceCollector:
         }
         
         try:
-            # Get real estate commitments
-            real_estate_data = await self._extract_pdf_data(
-                self.urls['commitment_books']['real_estate']
+            # Fetch real estate and personal property commitments concurrently
+            real_estate_data, personal_property_data = await asyncio.gather(
+                self._extract_pdf_data(self.urls['commitment_books']['real_estate']),
+                self._extract_pdf_data(self.urls['commitment_books']['personal_property']),
+                return_exceptions=True
             )
-            if real_estate_data:
+            if isinstance(real_estate_data, str) and real_estate_data:
                 data['real_estate'] = real_estate_data
                 
-            # Get personal property commitments
-            personal_property_data = await self._extract_pdf_data(
-                self.urls['commitment_books']['personal_property']
-            )
-            if personal_property_data:
+            if isinstance(personal_property_data, str) and personal_property_data:
                 data['personal_property'] = personal_property_data
                 
         except Exception as e:
@@ -99,26 +167,32 @@ class BrunswickResourceCollector:
         }
         
         try:
-            # Get index map
-            index_data = await self._extract_pdf_data(self.urls['tax_maps']['index'])
+            # Fetch the index map and any requested maps concurrently
+            wanted = [
+                n for n in dict.fromkeys(map_numbers or [])
+                if isinstance(n, int) and 1 <= n <= TAX_MAP_COUNT
+            ]
+            index_data, *map_results = await asyncio.gather(
+                self._extract_pdf_data(self.urls['tax_maps']['index']),
+                *(self._extract_pdf_data(self._tax_map_url(n)) for n in wanted)
+            )
             if index_data:
                 data['index'] = index_data
                 
-            # Get specific maps
-            if map_numbers:
-                for map_num in map_numbers:
-                    if 1 <= map_num <= 29:
-                        map_data = await self._extract_pdf_data(
-                            self.urls['tax_maps']['maps'][map_num - 1]
-                        )
-                        if map_data:
-                            data['maps'][map_num] = map_data
+            for map_num, map_data in zip(wanted, map_results):
+                if map_data:
+                    data['maps'][map_num] = map_data
                             
         except Exception as e:
             self.logger.error(f"Error getting tax map data: {e}")
             
         return data
         
+    @staticmethod
+    def _tax_map_url(map_num: int) -> str:
+        """DocumentCenter URL for a numbered tax map (the index map is 1259)"""
+        return f'https://www.brunswickme.gov/DocumentCenter/View/{1259 + map_num}/Map-{map_num}'
+        
     async def get_property_data(self, property_id: str) -> Dict:
         """Get property data from various sources"""
         data = {
@@ -128,18 +202,18 @@ class BrunswickResourceCollector:
         }
         
         try:
-            # Get property card
-            card_data = await self._scrape_property_card(property_id)
+            # Scrape the property card, deed and GIS sources concurrently
+            card_data, deed_data, gis_data = await asyncio.gather(
+                self._scrape_property_card(property_id),
+                self._scrape_deed_info(property_id),
+                self._scrape_gis_data(property_id)
+            )
             if card_data:
                 data['card'] = card_data
                 
-            # Get deed information
-            deed_data = await self._scrape_deed_info(property_id)
             if deed_data:
                 data['deed'] = deed_data
                 
-            # Get GIS data
-            gis_data = await self._scrape_gis_data(property_id)
             if gis_data:
                 data['gis'] = gis_data
                 
@@ -153,11 +227,9 @@ class BrunswickResourceCollector:
         sales = []
         
         try:
-            # Determine which sales book to use
-            if year == 2024:
-                url = self.urls['sales_books']['2024_2025']
-            else:
-                url = self.urls['sales_books']['2023_2024']
+            # Sales books span two years; fall back to the 2023-2024 book
+            sales_books = self.urls['sales_books']
+            url = sales_books.get(f'{year}_{year + 1}', sales_books['2023_2024'])
                 
             sales_data = await self._extract_pdf_data(url)
             if sales_data:
@@ -178,7 +250,7 @@ class BrunswickResourceCollector:
         
         try:
             # Get URL for specified year and type
-            url = self.urls['tax_bills'][bill_type].get(str(year))
+            url = self._tax_bill_index.get((bill_type, year))
             if url:
                 bill_data = await self._extract_pdf_data(url)
                 if bill_data:
@@ -189,54 +261,82 @@ class BrunswickResourceCollector:
             
         return bills
         
+    async def _get(self, url: str, text: bool = False) -> Optional[Union[str, bytes]]:
+        """Cached, rate-limited GET with retries; returns the body or None"""
+        body = await cached_fetch(self.session, self._sem, self.cache_dir, url)
+        if body is not None and text:
+            return body.decode('utf-8', errors='replace')
+        return body
+        
     async def _extract_pdf_data(self, url: str) -> Optional[str]:
         """Extract text from PDF URL"""
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    pdf_content = await response.read()
-                    pdf_file = io.BytesIO(pdf_content)
-                    
-                    reader = PyPDF2.PdfReader(pdf_file)
-                    text = ""
-                    for page in reader.pages:
-                        text += page.extract_text()
-                        
-                    return text
-                    
+            # Extracted text is cached next to the raw PDF bytes
+            text_path = cache_path(self.cache_dir, url, '.txt')
+            cached_text = await asyncio.to_thread(read_cache, text_path)
+            if cached_text is not None:
+                return cached_text.decode('utf-8')
+                
+            # Stream the PDF into the cache rather than holding it in memory,
+            # and hand the worker its path instead of pickling the bytes
+            pdf_path = await cached_fetch_path(self.session, self._sem, self.cache_dir, url)
+        except FETCH_ERRORS + (OSError,) as e:
+            self.logger.error(f"Error downloading PDF data: {e}")
+            return None
+            
+        if not pdf_path:
+            return None
+            
+        try:
+            text = await asyncio.get_running_loop().run_in_executor(
+                self._pdf_executor, _sync_extract_pdf_text, str(pdf_path)
+            )
         except Exception as e:
+            # PDF readers raise a wide range of errors on malformed files
             self.logger.error(f"Error extracting PDF data: {e}")
+            return None
             
-        return None
+        await asyncio.to_thread(write_cache, text_path, text.encode('utf-8'))
+        return text
         
     async def _scrape_property_card(self, property_id: str) -> Optional[Dict]:
         """Scrape property card data from Vision Government Solutions"""
         try:
             url = f"{self.urls['property_search']['cards']}?pid={property_id}"
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+            html = await self._get(url, text=True)
+            if html:
+                soup = BeautifulSoup(html, HTML_PARSER)
+                
+                data = {}
+                
+                # Extract property details
+                details = soup.find('div', {'id': 'MainContent_lblGeneral'})
+                if details:
+                    data['details'] = self._parse_property_details(details)
                     
-                    data = {}
+                # Extract assessment info
+                assessment = soup.find('div', {'id': 'MainContent_lblAssess'})
+                if assessment:
+                    data['assessment'] = self._parse_assessment(assessment)
                     
-                    # Extract property details
-                    details = soup.find('div', {'id': 'MainContent_lblGeneral'})
-                    if details:
-                        data['details'] = self._parse_property_details(details)
-                        
-                    # Extract assessment info
-                    assessment = soup.find('div', {'id': 'MainContent_lblAssess'})
-                    if assessment:
-                        data['assessment'] = self._parse_assessment(assessment)
-                        
-                    return data
+                return data
                     
-        except Exception as e:
+        except FETCH_ERRORS as e:
             self.logger.error(f"Error scraping property card: {e}")
             
         return None
         
+    async def _scrape_deed_info(self, property_id: str) -> Optional[Dict]:
+        """Scrape deed information from the Cumberland County registry"""
+        # The registry search requires an interactive session; placeholder
+        # until a direct lookup is available
+        return None
+        
+    async def _scrape_gis_data(self, property_id: str) -> Optional[Dict]:
+        """Scrape parcel data from the ArcGIS experience"""
+        # Placeholder; parcel layers are collected by BrunswickGISCollector
+        return None
+        
     def _parse_property_details(self, element: BeautifulSoup) -> Dict:
         """Parse property details from Vision Government Solutions"""
         details = {}
@@ -265,8 +365,7 @@ class BrunswickResourceCollector:
                     # Convert currency strings to numbers
                     val_text = value.text.strip()
                     if '$' in val_text:
-                        val_text = val_text.replace('$', '').replace(',', '')
-                        assessment[key] = float(val_text)
+                        assessment[key] = float(val_text.translate(_CURRENCY_STRIP))
                     else:
                         assessment[key] = val_text
         except Exception as e:
@@ -0,0 +1,128 @@
+"""
+Sample Brunswick tax assessment records
+
+Only the tax assessment collector's fallback path uses these, so they live
+here and numpy is imported only when that path actually runs. The columns
+are drawn as arrays; get_sample_batch() hands them to pyarrow as-is and
+get_sample_data() packs them into the dicts the collector returns.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+# pyarrow is optional; it is only needed for columnar (get_sample_batch) output
+PYARROW_AVAILABLE = False
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pass
+
+# Choice pools, built once rather than on every call
+_STREETS = np.array(['Main', 'Elm', 'Oak', 'Pine', 'Maple'])
+_SURNAMES = np.array(['Smith', 'Johnson', 'Williams', 'Jones', 'Brown', 'Davis', 'Miller', 'Wilson'])
+_PROPERTY_TYPES = np.array(["Single Family", "Multi-Family", "Commercial", "Vacant Land"])
+_ZONES = np.array(["R1", "R2", "R3", "C1", "I1"])
+
+def _sample_columns(n: int = 20, seed: Optional[int] = None) -> Dict[str, Any]:
+    """Draw every sample field as one column: numpy arrays for numbers, lists otherwise"""
+    # Draw each column in one RNG call; a fixed seed reproduces the same sample
+    rng = np.random.default_rng(seed)
+    
+    assessed_values = rng.integers(150000, 800001, size=n)
+    last_sale_prices = (assessed_values * rng.uniform(0.7, 1.3, size=n)).astype(int)
+    now = datetime.now()
+    today = np.datetime64(now.date(), 'D')
+    sale_dates = today - rng.integers(30, 3651, size=n).astype('timedelta64[D]')
+    
+    # Up to 3 previous owners per property, each 2-10 years before the next
+    # sale at a generally lower price; rows are cut to each property's count
+    previous_owners = rng.integers(1, 4, size=n).tolist()
+    history_gaps = rng.integers(730, 3651, size=(n, 3)).cumsum(axis=1)
+    history_dates = np.datetime_as_string(sale_dates[:, None] - history_gaps.astype('timedelta64[D]'), unit='D').tolist()
+    history_prices = (last_sale_prices[:, None] * rng.uniform(0.7, 0.95, size=(n, 3)).cumprod(axis=1)).astype(int).tolist()
+    history_buyers = rng.choice(_SURNAMES, size=(n, 3)).tolist()
+    
+    house_numbers = rng.integers(1, 1000, size=n).tolist()
+    streets = rng.choice(_STREETS, size=n).tolist()
+    surnames = rng.choice(_SURNAMES, size=n).tolist()
+    
+    return {
+        # Size the string dtype from n so IDs past 9999 aren't truncated
+        "parcel_id": np.char.add('SAMPLE', np.char.zfill(np.arange(1, n + 1).astype(f'U{max(4, len(str(n)))}'), 4)).tolist(),
+        "property_address": [f"{number} {street} St, Brunswick, ME 04011" for number, street in zip(house_numbers, streets)],
+        "owner_name": [f"{surname} Family" for surname in surnames],
+        "assessed_value": assessed_values,
+        "land_value": (assessed_values * 0.3).astype(int),
+        "building_value": (assessed_values * 0.7).astype(int),
+        "year_built": rng.integers(1900, 2016, size=n),
+        "property_type": rng.choice(_PROPERTY_TYPES, size=n).tolist(),
+        "living_area": rng.integers(1000, 4001, size=n),
+        "lot_size": np.round(rng.uniform(0.1, 5.0, size=n), 2),
+        "bedrooms": rng.integers(2, 7, size=n),
+        "bathrooms": rng.integers(1, 5, size=n),
+        "zone": rng.choice(_ZONES, size=n).tolist(),
+        "last_sale_date": np.datetime_as_string(sale_dates, unit='D').tolist(),
+        "last_sale_price": last_sale_prices,
+        "is_foreclosure": rng.random(size=n) < 0.05,  # 5% chance of being a foreclosure
+        "data_source": ["Brunswick Tax Assessment (Sample)"] * n,
+        "collection_date": [now.strftime("%Y-%m-%d")] * n,
+        "ownership_history": [
+            [
+                {"date": date, "price": price, "buyer": f"{buyer} Family"}
+                for date, price, buyer in zip(dates[:count], prices[:count], buyers[:count])
+            ]
+            for count, dates, prices, buyers in zip(previous_owners, history_dates, history_prices, history_buyers)
+        ]
+    }
+
+def get_sample_batch(seed: Optional[int] = None) -> "pa.RecordBatch":
+    """
+    Generate sample property data as a columnar pyarrow RecordBatch
+    
+    Numeric columns are handed over straight from numpy and
+    ownership_history becomes a list<struct> column.
+    
+    Args:
+        seed: RNG seed for a reproducible sample
+        
+    Returns:
+        RecordBatch with one row per sample property
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for columnar sample data. Install with: pip install pyarrow")
+    return pa.RecordBatch.from_pydict(_sample_columns(seed=seed))
+
+def iter_sample_data(count: int = 20, seed: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield sample property data for testing one record at a time
+    
+    The columns are drawn up front; each record dict is only built when the
+    consumer asks for it.
+    
+    Args:
+        count: Number of sample properties
+        seed: RNG seed for a reproducible sample
+        
+    Yields:
+        Sample property data dictionaries
+    """
+    columns = _sample_columns(count, seed)
+    # tolist() turns numpy scalars back into JSON-serializable Python values
+    values = [column.tolist() if isinstance(column, np.ndarray) else column for column in columns.values()]
+    for row in zip(*values):
+        yield dict(zip(columns, row))
+
+def get_sample_data(seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Generate sample property data for testing
+    
+    Args:
+        seed: RNG seed for a reproducible sample
+        
+    Returns:
+        List of sample property data dictionaries
+    """
+    return list(iter_sample_data(seed=seed))
@@ -8,18 +8,23 @@ It scrapes the online property card system for comprehensive property informatio
 
 import os
 import sys
+import asyncio
 import json
+import hashlib
 import logging
 import time
 import random
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Set
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Any, Iterable, Optional, Tuple, Set, Union
 from pathlib import Path
 from urllib.parse import urljoin, parse_qs, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
@@ -31,6 +36,193 @@ from src.collectors.base_collector import BaseCollector
 from src.utils.cache_manager import CacheManager
 from src.utils.config_loader import ConfigLoader
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    json_loads = json.loads
+
+# Patterns used per row/field while parsing vgsi pages
+_PID_RE = re.compile(r'PID=([^&]+)')
+_NONDIGIT_DOT_RE = re.compile(r'[^\d.]')
+_NONDIGIT_RE = re.compile(r'[^\d]')
+_LEADING_NUM_RE = re.compile(r'([\d.]+)')
+
+# aiohttp multiplexes the parcel detail GETs on one event loop; without it
+# they go through a thread pool on the requests session
+AIOHTTP_AVAILABLE = False
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    logging.warning("aiohttp not available, fetching parcel pages with a thread pool. Install with: pip install aiohttp")
+
+# Prefer the C-backed lxml parser for the BeautifulSoup fallback
+HTML_PARSER = 'html.parser'
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    logging.warning("lxml not available, falling back to html.parser. Install with: pip install lxml")
+
+# selectolax's Lexbor parser does both parsing and CSS matching in C
+SELECTOLAX_AVAILABLE = False
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    logging.warning("selectolax not available, falling back to BeautifulSoup. Install with: pip install selectolax")
+
+def _parse_html(html: Union[str, bytes], parse_only: Optional[SoupStrainer] = None):
+    """
+    Parse HTML (str, or raw bytes to skip decoding) with selectolax when
+    available, BeautifulSoup otherwise; parse_only limits which tags the
+    BeautifulSoup fallback builds
+    """
+    if SELECTOLAX_AVAILABLE:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+def _css(node, selector: str) -> List:
+    """All nodes under node matching a CSS selector"""
+    if SELECTOLAX_AVAILABLE:
+        return node.css(selector)
+    return node.select(selector)
+
+def _css_first(node, selector: str):
+    """First node under node matching a CSS selector, or None"""
+    if SELECTOLAX_AVAILABLE:
+        return node.css_first(selector)
+    return node.select_one(selector)
+
+def _text(node) -> str:
+    """Stripped text content of a node"""
+    if SELECTOLAX_AVAILABLE:
+        return node.text(strip=True)
+    return node.get_text(strip=True)
+
+def _attr(node, name: str) -> Optional[str]:
+    """Attribute value of a node, or None"""
+    if SELECTOLAX_AVAILABLE:
+        return node.attributes.get(name)
+    return node.get(name)
+
+def _cells(row) -> List:
+    """td and th cells under a table row, in document order"""
+    if SELECTOLAX_AVAILABLE:
+        return [node for node in row.css('*') if node.tag in ('td', 'th')]
+    return row.find_all(['td', 'th'])
+
+def _label_map(section) -> Dict[str, str]:
+    """Map each row's label cell (trailing colon dropped) to the text of the cell after it"""
+    labels = {}
+    for row in _css(section, 'tr'):
+        cells = _cells(row)
+        if len(cells) >= 2:
+            labels.setdefault(_text(cells[0]).rstrip(':').strip(), _text(cells[1]))
+    return labels
+
+def _parse_iso_date(value: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD date by slicing, or None if it isn't one"""
+    try:
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    except (ValueError, TypeError):
+        return None
+
+# ASP.NET hidden inputs that must be echoed back on every search postback
+_FORM_TOKEN_NAMES = ('__VIEWSTATE', '__VIEWSTATEGENERATOR', '__EVENTVALIDATION')
+
+# Search result pages only need the results grid, the pager links and the
+# form inputs; scripts, styles and layout markup are never built as soup
+_SEARCH_RESULTS_STRAINER = SoupStrainer(['table', 'a', 'input'])
+
+def _form_tokens(tree) -> Dict[str, str]:
+    """Values of the ASP.NET form-state inputs present on a parsed page"""
+    tokens = {}
+    for node in _css(tree, 'input[name^="__"]'):
+        name = _attr(node, 'name')
+        if name in _FORM_TOKEN_NAMES:
+            tokens[name] = _attr(node, 'value') or ''
+    return tokens
+
+def _event_loop_running() -> bool:
+    """Whether the calling thread is already running an asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+class _RateLimiter:
+    """Spaces calls to acquire() at least interval seconds apart across threads"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        
+    def reserve(self) -> float:
+        """Claim the next request slot and return the seconds to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            # Jitter keeps the requests from looking machine-timed
+            self._next_slot = max(now, self._next_slot) + self.interval * (1 + random.uniform(-0.2, 0.2))
+        return max(wait, 0.0)
+        
+    def acquire(self) -> None:
+        """Block until the next request slot is free"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+class _ParcelStore:
+    """SQLite store of one collection run's parcels, written in batches as pages arrive"""
+    
+    BATCH_SIZE = 100
+    
+    def __init__(self, db_path: Path, run_key: str):
+        self.run_key = run_key
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("CREATE TABLE IF NOT EXISTS parcels (pid TEXT PRIMARY KEY, run_key TEXT, data TEXT, ts INTEGER)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS runs (run_key TEXT PRIMARY KEY, count INTEGER, ts INTEGER)")
+        self._conn.commit()
+        self._pending = []
+        
+    def is_complete(self) -> bool:
+        """Whether this run already finished and was recorded"""
+        row = self._conn.execute("SELECT 1 FROM runs WHERE run_key = ?", (self.run_key,)).fetchone()
+        return row is not None
+        
+    def load(self) -> List[Dict[str, Any]]:
+        """Every parcel stored so far under this run"""
+        rows = self._conn.execute("SELECT data FROM parcels WHERE run_key = ?", (self.run_key,))
+        return [json_loads(data) for (data,) in rows]
+        
+    def add(self, property_data: Dict[str, Any]) -> None:
+        """Queue a parcel, writing the queue out once it reaches BATCH_SIZE"""
+        self._pending.append((property_data["parcel_id"], self.run_key, json_dumps(property_data).decode('utf-8'), int(time.time())))
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+            
+    def flush(self) -> None:
+        """Write queued parcels"""
+        if self._pending:
+            self._conn.executemany("INSERT OR REPLACE INTO parcels VALUES (?, ?, ?, ?)", self._pending)
+            self._conn.commit()
+            self._pending = []
+            
+    def mark_complete(self, count: int) -> None:
+        """Flush and record the run as finished so later calls reuse it"""
+        self.flush()
+        self._conn.execute("INSERT OR REPLACE INTO runs VALUES (?, ?, ?)", (self.run_key, count, int(time.time())))
+        self._conn.commit()
+        
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
+
 class BrunswickTaxAssessmentCollector(BaseCollector):
     """
     Collects property data from the Brunswick tax assessment database
@@ -40,6 +232,7 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
     SEARCH_URL = f"{BASE_URL}/Search.aspx"
     PARCEL_URL = f"{BASE_URL}/Parcel.aspx"
     CARDS_PER_PAGE = 15  # Default number of cards per page on the Brunswick website
+    RETRY_STATUSES = [429, 500, 502, 503, 504]
     
     def __init__(self, 
                  cache_dir: Optional[Path] = None,
@@ -49,6 +242,7 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
                  batch_size: Optional[int] = None,
                  rate_limit: Optional[int] = None,
                  region: Optional[str] = None,
+                 sample_seed: Optional[int] = None,
                  **kwargs):
         """
         Initialize the Brunswick tax assessment collector
@@ -61,6 +255,7 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
             batch_size: Size of batches for processing (if applicable)
             rate_limit: Number of requests per second (if applicable)
             region: Region name for filtering (if applicable)
+            sample_seed: RNG seed for the fallback sample data, for reproducible runs
             **kwargs: Additional parameters that may be passed from the pipeline
         """
         # Call the parent constructor with appropriate parameters
@@ -98,6 +293,14 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
         self.throttle_delay = collector_config.get("throttle_delay", 1.0)
         self.retry_attempts = collector_config.get("retry_attempts", 3)
         self.timeout = collector_config.get("timeout", 30)
+        self.rate_limit = collector_config.get("rate_limit", rate_limit)
+        self.sample_seed = collector_config.get("sample_seed", sample_seed)
+        self.max_workers = collector_config.get("max_workers", min(8, self.rate_limit or 8))
+        
+        # Detail pages are fetched from a thread pool; the limiter keeps the
+        # overall request rate at rate_limit/s, or one per throttle_delay
+        interval = 1.0 / self.rate_limit if self.rate_limit else self.throttle_delay
+        self.rate_limiter = _RateLimiter(interval)
         
         # Override session with our customized one
         self.session = self._create_robust_session()
@@ -105,6 +308,8 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
         })
         
         # Set up cache manager for our own caching implementation
@@ -119,6 +324,9 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
         self.event_validation = None
         self.view_state_generator = None
         
+        # Date stamped on every parcel; collect() sets it once per run
+        self.collection_date = datetime.now().strftime("%Y-%m-%d")
+        
     def _create_robust_session(self) -> requests.Session:
         """
         Create a requests session with retry capabilities
@@ -131,11 +339,18 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
         retry_strategy = Retry(
             total=self.retry_attempts,
             backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=self.RETRY_STATUSES,
             allowed_methods=["GET", "POST"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # vgsi.com is the only host, so one pool sized above the worker
+        # count keeps every detail fetch on a reused keep-alive connection
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=1,
+            pool_maxsize=max(32, self.max_workers),
+            pool_block=False
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -158,18 +373,23 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
         """
         self.logger.info("Starting Brunswick tax assessment data collection")
         
-        # Try to load from cache first
-        cache_key = f"brunswick_tax_assessment_data_{datetime.now().strftime('%Y%m%d')}"
-        cached_data = self.cache_manager.get(cache_key)
-        
-        if cached_data:
-            self.logger.info(f"Using cached data with {len(cached_data)} properties from {cache_key}")
-            return cached_data
-        
-        # If not in cache, collect fresh data
-        self.logger.info("No cache found, collecting fresh data")
+        # Parsed parcels are written to SQLite in batches as they come in, so a
+        # finished run is reused for the day and a crashed one resumes
+        now = datetime.now()
+        self.collection_date = now.strftime("%Y-%m-%d")
+        cache_key = f"brunswick_tax_assessment_data_{now.strftime('%Y%m%d')}"
+        store = _ParcelStore(Path(self.cache_dir) / "parcels.db", cache_key)
         
         try:
+            # Try to load from cache first
+            if store.is_complete():
+                cached_data = store.load()
+                self.logger.info(f"Using cached data with {len(cached_data)} properties from {cache_key}")
+                return cached_data
+            
+            # If not in cache, collect fresh data
+            self.logger.info("No cache found, collecting fresh data")
+            
             # Initialize the search form to get form tokens
             self._initialize_search_form()
             
@@ -183,45 +403,31 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
                 self.logger.info(f"Limiting to {self.max_properties} properties as configured")
                 parcels = parcels[:self.max_properties]
             
-            # Collect detailed data for each parcel
-            properties = []
-            processed_count = 0
-            error_count = 0
+            # Pick up where an interrupted run left off
+            stored = store.load()
+            if stored:
+                stored_ids = {prop["parcel_id"] for prop in stored}
+                parcels = [parcel_id for parcel_id in parcels if parcel_id not in stored_ids]
+                self.logger.info(f"Resuming with {len(stored)} properties already stored, {len(parcels)} left")
             
-            for i, parcel_id in enumerate(parcels):
-                try:
-                    # Add throttle delay to avoid overloading the server
-                    if i > 0:
-                        delay = self.throttle_delay * (1 + random.uniform(-0.2, 0.2))  # Add jitter
-                        time.sleep(delay)
-                    
-                    # Get detailed property data
-                    property_data = self._get_property_details(parcel_id)
-                    if property_data:
-                        properties.append(property_data)
-                        processed_count += 1
-                        
-                    # Log progress
-                    if (i + 1) % 10 == 0 or (i + 1) == len(parcels):
-                        self.logger.info(f"Processed {i + 1}/{len(parcels)} parcels ({processed_count} successful, {error_count} errors)")
-                        
-                except Exception as e:
-                    error_count += 1
-                    self.logger.error(f"Error processing parcel {parcel_id}: {str(e)}")
-                    
-                    # If too many errors, break
-                    if error_count > min(50, len(parcels) * 0.2):  # 20% error threshold
-                        self.logger.warning(f"Stopping due to high error rate ({error_count}/{i+1})")
-                        break
+            # Collect detailed data for each parcel; asyncio.run can't start
+            # inside a caller's running event loop, so use the thread pool there
+            if AIOHTTP_AVAILABLE and not _event_loop_running():
+                properties, error_count = asyncio.run(self._collect_async(parcels, store))
+            else:
+                properties, error_count = self._collect_threaded(parcels, store)
+            properties = stored + properties
             
             # If we didn't get any properties from the API, use sample data
             if not properties:
                 self.logger.warning("No properties collected from API, using sample data for testing")
                 properties = self._get_sample_data()
+                for property_data in properties:
+                    store.add(property_data)
             
             if properties:
                 # Cache the results
-                self.cache_manager.set(cache_key, properties)
+                store.mark_complete(len(properties))
                 self.logger.info(f"Cached {len(properties)} properties with key {cache_key}")
             else:
                 self.logger.warning("No properties collected, nothing to cache")
@@ -234,6 +440,112 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
             # Return sample data for testing
             self.logger.warning("Using sample data for testing due to collection error")
             return self._get_sample_data()
+        finally:
+            # Whatever was fetched before a failure stays on disk for the resume
+            store.flush()
+            store.close()
+    
+    def _collect_threaded(self, parcels: List[str], store: _ParcelStore) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch parcel detail pages from a thread pool on the requests session
+        
+        Args:
+            parcels: Parcel IDs to fetch
+            store: Store each parsed parcel is written to
+        
+        Returns:
+            Tuple of (property data dictionaries, error count)
+        """
+        properties = []
+        processed_count = 0
+        error_count = 0
+        error_threshold = min(50, int(len(parcels) * 0.2))  # 20% error threshold
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._get_property_details, parcel_id): parcel_id
+                       for parcel_id in parcels}
+            
+            for i, future in enumerate(as_completed(futures)):
+                parcel_id = futures[future]
+                try:
+                    # Get detailed property data
+                    property_data = future.result()
+                    if property_data:
+                        properties.append(property_data)
+                        processed_count += 1
+                        store.add(property_data)
+                
+                except Exception as e:
+                    error_count += 1
+                    self.logger.error(f"Error processing parcel {parcel_id}: {str(e)}")
+                    
+                    # If too many errors, stop and drop the parcels still queued
+                    if error_count > error_threshold:
+                        self.logger.warning(f"Stopping due to high error rate ({error_count}/{i+1})")
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                
+                # Log progress
+                if (i + 1) % 10 == 0 or (i + 1) == len(parcels):
+                    self.logger.info(f"Processed {i + 1}/{len(parcels)} parcels ({processed_count} successful, {error_count} errors)")
+        
+        return properties, error_count
+    
+    async def _collect_async(self, parcels: List[str], store: _ParcelStore) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch parcel detail pages concurrently on one aiohttp session
+        
+        Args:
+            parcels: Parcel IDs to fetch
+            store: Store each parsed parcel is written to
+            
+        Returns:
+            Tuple of (property data dictionaries, error count)
+        """
+        properties = []
+        processed_count = 0
+        error_count = 0
+        error_threshold = min(50, int(len(parcels) * 0.2))  # 20% error threshold
+        
+        # Same headers and ASP.NET session cookies as the search requests;
+        # verification is off to match the requests session
+        connector = aiohttp.TCPConnector(limit=self.max_workers, ttl_dns_cache=300, ssl=False)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=dict(self.session.headers),
+                                         cookies=self.session.cookies.get_dict()) as session:
+            tasks = [asyncio.ensure_future(self._get_property_details_async(session, semaphore, parcel_id))
+                     for parcel_id in parcels]
+            try:
+                for i, next_done in enumerate(asyncio.as_completed(tasks)):
+                    try:
+                        # Get detailed property data
+                        property_data = await next_done
+                        if property_data:
+                            properties.append(property_data)
+                            processed_count += 1
+                            store.add(property_data)
+                            
+                    except Exception as e:
+                        error_count += 1
+                        self.logger.error(f"Error processing parcel: {str(e)}")
+                        
+                        # If too many errors, stop; the finally block drops the rest
+                        if error_count > error_threshold:
+                            self.logger.warning(f"Stopping due to high error rate ({error_count}/{i+1})")
+                            break
+                    
+                    # Log progress
+                    if (i + 1) % 10 == 0 or (i + 1) == len(parcels):
+                        self.logger.info(f"Processed {i + 1}/{len(parcels)} parcels ({processed_count} successful, {error_count} errors)")
+            finally:
+                for task in tasks:
+                    task.cancel()
+        
+        return properties, error_count
     
     def _initialize_search_form(self) -> bool:
         """
@@ -248,13 +560,11 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
             response = self.session.get(self.SEARCH_URL, timeout=self.timeout)
             response.raise_for_status()
             
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
             # Extract form values
-            self.view_state = soup.find('input', {'name': '__VIEWSTATE'})['value']
-            self.event_validation = soup.find('input', {'name': '__EVENTVALIDATION'})['value']
-            self.view_state_generator = soup.find('input', {'name': '__VIEWSTATEGENERATOR'})['value']
+            form_tokens = _form_tokens(_parse_html(response.content))
+            self.view_state = form_tokens['__VIEWSTATE']
+            self.event_validation = form_tokens['__EVENTVALIDATION']
+            self.view_state_generator = form_tokens['__VIEWSTATEGENERATOR']
             
             self.logger.debug("Successfully initialized search form")
             return True
@@ -291,29 +601,21 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
             response = self.session.post(self.SEARCH_URL, data=form_data, timeout=self.timeout)
             response.raise_for_status()
             
-            # Parse the results page
-            parcel_ids = self._parse_search_results(response.text)
+            # Parse the results page along with its pager link and form tokens
+            parcel_ids, event_target, form_tokens = self._parse_search_results(response.content)
             
             # If we have multiple pages, navigate through them
             page = 1
-            while True:
-                # Look for the "Next" page link and follow it if present
-                soup = BeautifulSoup(response.text, 'html.parser')
-                next_link = soup.find('a', text=lambda text: text and 'Next' in text)
-                
-                if not next_link:
-                    break  # No more pages
+            while event_target:
+                # Update form tokens for next request
+                if len(form_tokens) == len(_FORM_TOKEN_NAMES):
+                    self.view_state = form_tokens['__VIEWSTATE']
+                    self.event_validation = form_tokens['__EVENTVALIDATION']
+                    self.view_state_generator = form_tokens['__VIEWSTATEGENERATOR']
                 
                 page += 1
                 self.logger.info(f"Navigating to page {page} of results")
                 
-                # Get the event target and argument for the next page
-                event_target = next_link.get('href', '').split("'")[1] if "'" in next_link.get('href', '') else ''
-                
-                if not event_target:
-                    self.logger.warning("Could not find event target for next page")
-                    break
-                
                 # Update form data for pagination
                 form_data = {
                     "__VIEWSTATE": self.view_state,
@@ -330,20 +632,9 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
                 response.raise_for_status()
                 
                 # Parse the new page of results
-                page_parcel_ids = self._parse_search_results(response.text)
+                page_parcel_ids, event_target, form_tokens = self._parse_search_results(response.content)
                 parcel_ids.extend(page_parcel_ids)
                 
-                # Update form tokens for next request
-                soup = BeautifulSoup(response.text, 'html.parser')
-                view_state_element = soup.find('input', {'name': '__VIEWSTATE'})
-                event_validation_element = soup.find('input', {'name': '__EVENTVALIDATION'})
-                view_state_generator_element = soup.find('input', {'name': '__VIEWSTATEGENERATOR'})
-                
-                if view_state_element and event_validation_element and view_state_generator_element:
-                    self.view_state = view_state_element['value']
-                    self.event_validation = event_validation_element['value']
-                    self.view_state_generator = view_state_generator_element['value']
-                
             self.logger.info(f"Found {len(parcel_ids)} parcels in total")
             return parcel_ids
             
@@ -351,43 +642,53 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
             self.logger.error(f"Error searching parcels: {str(e)}")
             return []
     
-    def _parse_search_results(self, html: str) -> List[str]:
+    def _parse_search_results(self, html: Union[str, bytes]) -> Tuple[List[str], Optional[str], Dict[str, str]]:
         """
-        Parse search results page to extract parcel IDs
+        Parse search results page to extract parcel IDs, the next-page
+        postback target and the page's form tokens in a single parse
         
         Args:
             html: HTML content of search results page
             
         Returns:
-            List of parcel IDs
+            Tuple of (parcel IDs, __EVENTTARGET of the "Next" link or None
+            on the last page, form token values by input name)
         """
         parcel_ids = []
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = _parse_html(html, parse_only=_SEARCH_RESULTS_STRAINER)
         
         # Find the results grid
-        results_table = soup.find('table', {'id': 'ctl00_MainContent_grdSearchResults'})
-        if not results_table:
+        results_table = _css_first(tree, 'table#ctl00_MainContent_grdSearchResults')
+        if results_table is None:
             self.logger.warning("No results table found in response")
-            return parcel_ids
+        else:
+            # Find all row links - each contains a parcel ID in the URL
+            for row in _css(results_table, 'tr'):
+                # Skip header row
+                if _css_first(row, 'th') is not None:
+                    continue
+                    
+                # Find the link containing the parcel ID
+                link = _css_first(row, 'a[href*="PID="]')
+                if link is not None:
+                    # Extract the parcel ID from the URL
+                    href = _attr(link, 'href') or ''
+                    pid_match = _PID_RE.search(href)
+                    if pid_match:
+                        parcel_ids.append(pid_match.group(1))
         
-        # Find all row links - each contains a parcel ID in the URL
-        for row in results_table.find_all('tr'):
-            # Skip header row
-            if row.find('th'):
-                continue
-                
-            # Find the link containing the parcel ID
-            link = row.find('a', href=lambda href: href and 'PID=' in href)
-            if link:
-                # Extract the parcel ID from the URL
-                parcel_id = None
-                href = link.get('href', '')
-                pid_match = re.search(r'PID=([^&]+)', href)
-                if pid_match:
-                    parcel_id = pid_match.group(1)
-                    parcel_ids.append(parcel_id)
-            
-        return parcel_ids
+        # Look for the "Next" page link and pull its postback event target
+        event_target = None
+        for link in _css(tree, 'a[href]'):
+            if 'Next' in _text(link):
+                href = _attr(link, 'href')
+                if "'" in href:
+                    event_target = href.split("'")[1]
+                else:
+                    self.logger.warning("Could not find event target for next page")
+                break
+        
+        return parcel_ids, event_target, _form_tokens(tree)
     
     def _get_property_details(self, parcel_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -405,23 +706,174 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
             # Construct property detail URL
             url = f"{self.PARCEL_URL}?pid={parcel_id}"
             
+            # Revalidate against the validators saved last run; a 304 means the
+            # page is unchanged and its parse is already in the cache
+            meta, headers = self._revalidation_headers(parcel_id)
+            
             # Get the property detail page
-            response = self.session.get(url, timeout=self.timeout)
+            status, body, response_headers = self._get_streamed(url, headers)
+            
+            if status == 304:
+                property_data = self._cached_parse(meta.get("content_hash"))
+                if property_data:
+                    return property_data
+                # Cached parse has expired; fetch the full page again
+                status, body, response_headers = self._get_streamed(url)
+            
+            return self._property_from_page(parcel_id, body, response_headers)
+            
+        except Exception as e:
+            self.logger.error(f"Error getting property details for {parcel_id}: {str(e)}")
+            return None
+    
+    def _get_streamed(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes, Any]:
+        """
+        GET a URL under the rate limit, reading the body in chunks
+        
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            
+        Returns:
+            Tuple of (status code, response body, response headers)
+        """
+        self.rate_limiter.acquire()
+        # Closing the response as soon as the body is read hands the
+        # connection straight back to the pool for the other workers
+        with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
             response.raise_for_status()
+            body = b''.join(response.iter_content(chunk_size=65536))
+            return response.status_code, body, response.headers
+    
+    async def _get_property_details_async(self, session, semaphore: asyncio.Semaphore,
+                                          parcel_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get detailed information for a specific property over aiohttp
+        
+        Args:
+            session: Shared aiohttp session
+            semaphore: Bounds the number of requests in flight
+            parcel_id: Parcel identifier
             
-            # Extract property data
-            return self._parse_property_detail_page(response.text, parcel_id)
+        Returns:
+            Dictionary with property details, or None if not found
+        """
+        self.logger.debug(f"Getting details for parcel {parcel_id}")
+        
+        try:
+            url = f"{self.PARCEL_URL}?pid={parcel_id}"
+            meta, headers = self._revalidation_headers(parcel_id)
+            
+            async with semaphore:
+                status, body, response_headers = await self._get_async(session, url, headers)
+                if status == 304:
+                    property_data = self._cached_parse(meta.get("content_hash"))
+                    if property_data:
+                        return property_data
+                    # Cached parse has expired; fetch the full page again
+                    status, body, response_headers = await self._get_async(session, url)
+            
+            # Parse off the event loop so the other requests keep moving
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._property_from_page, parcel_id, body, response_headers)
             
         except Exception as e:
             self.logger.error(f"Error getting property details for {parcel_id}: {str(e)}")
             return None
     
-    def _parse_property_detail_page(self, html: str, parcel_id: str) -> Dict[str, Any]:
+    async def _get_async(self, session, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes, Any]:
+        """
+        GET a URL under the rate limit, retrying like the requests session does
+        
+        Args:
+            session: Shared aiohttp session
+            url: URL to fetch
+            headers: Extra request headers
+            
+        Returns:
+            Tuple of (status code, response body, response headers)
+        """
+        for attempt in range(self.retry_attempts + 1):
+            await asyncio.sleep(self.rate_limiter.reserve())
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status not in self.RETRY_STATUSES or attempt == self.retry_attempts:
+                        response.raise_for_status()
+                        return response.status, await response.read(), response.headers
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.retry_attempts:
+                    raise
+            await asyncio.sleep(0.5 * 2 ** attempt)
+    
+    def _revalidation_headers(self, parcel_id: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Load a parcel's saved validators and build conditional request headers
+        
+        Args:
+            parcel_id: Parcel identifier
+            
+        Returns:
+            Tuple of (saved validator metadata, If-None-Match/If-Modified-Since headers)
+        """
+        meta = self.cache_manager.get(f"brunswick_tax_meta_{parcel_id}") or {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return meta, headers
+    
+    def _cached_parse(self, content_hash: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up an earlier parse of a page by the hash of its body
+        
+        Args:
+            content_hash: blake2b digest of the page body
+            
+        Returns:
+            Cached property details with a fresh collection date, or None
+        """
+        property_data = self.cache_manager.get(f"brunswick_tax_parse_{content_hash}")
+        if property_data:
+            property_data["collection_date"] = self.collection_date
+        return property_data
+    
+    def _property_from_page(self, parcel_id: str, content: bytes, response_headers) -> Dict[str, Any]:
+        """
+        Turn a fetched parcel page into property details, saving its validators
+        
+        Args:
+            parcel_id: Parcel identifier
+            content: Raw page body
+            response_headers: Response headers carrying ETag/Last-Modified
+            
+        Returns:
+            Dictionary with property details
+        """
+        # Pages that haven't changed since an earlier run parse to the same
+        # result, so look the parse up by a hash of the body first
+        content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+        self.cache_manager.set(f"brunswick_tax_meta_{parcel_id}", {
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "content_hash": content_hash
+        })
+        property_data = self._cached_parse(content_hash)
+        if property_data:
+            return property_data
+        
+        # Extract property data, handing the parser the raw body so the
+        # page is never decoded into a Python str first
+        property_data = self._parse_property_detail_page(content, parcel_id)
+        self.cache_manager.set(f"brunswick_tax_parse_{content_hash}", property_data)
+        return property_data
+    
+    def _parse_property_detail_page(self, html: Union[str, bytes], parcel_id: str) -> Dict[str, Any]:
         """
         Parse the property detail page to extract property information
         
         Args:
-            html: HTML content of property detail page
+            html: HTML content of property detail page, as text or raw bytes
             parcel_id: Parcel ID for reference
             
         Returns:
@@ -430,34 +882,40 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
         property_data = {
             "parcel_id": parcel_id,
             "data_source": "Brunswick Tax Assessment",
-            "collection_date": datetime.now().strftime("%Y-%m-%d")
+            "collection_date": self.collection_date
         }
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = _parse_html(html)
+        
+        # Index every MainContent_ element in one walk rather than running a
+        # separate descendant scan for each section below
+        by_id = {}
+        for node in _css(tree, '[id^="MainContent_"]'):
+            by_id.setdefault(_attr(node, 'id'), node)
         
         # Extract property address
-        address_section = soup.find('div', {'id': 'MainContent_lblPropertyAddress'})
-        if address_section:
-            property_data["property_address"] = address_section.get_text(strip=True)
+        address_section = by_id.get('MainContent_lblPropertyAddress')
+        if address_section is not None:
+            property_data["property_address"] = _text(address_section)
         
         # Extract owner information
-        owner_section = soup.find('div', {'id': 'MainContent_lblOwner'})
-        if owner_section:
-            property_data["owner_name"] = owner_section.get_text(strip=True)
+        owner_section = by_id.get('MainContent_lblOwner')
+        if owner_section is not None:
+            property_data["owner_name"] = _text(owner_section)
         
         # Extract assessment values
-        assessment_table = soup.find('table', {'id': 'MainContent_grdCurrentValueAppr'})
-        if assessment_table:
-            rows = assessment_table.find_all('tr')
+        assessment_table = by_id.get('MainContent_grdCurrentValueAppr')
+        if assessment_table is not None:
+            rows = _css(assessment_table, 'tr')
             for row in rows:
-                cells = row.find_all(['td', 'th'])
+                cells = _cells(row)
                 if len(cells) >= 2:
-                    label = cells[0].get_text(strip=True)
-                    value_text = cells[1].get_text(strip=True)
+                    label = _text(cells[0])
+                    value_text = _text(cells[1])
                     
                     # Try to convert to numeric value
                     try:
-                        value = float(re.sub(r'[^\d.]', '', value_text))
+                        value = float(_NONDIGIT_DOT_RE.sub('', value_text))
                     except ValueError:
                         value = value_text
                     
@@ -469,120 +927,94 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
                         property_data["assessed_value"] = value
         
         # Extract building information
-        building_section = soup.find('div', {'id': 'MainContent_panelStructure'})
-        if building_section:
+        building_section = by_id.get('MainContent_panelStructure')
+        if building_section is not None:
+            building_labels = _label_map(building_section)
+            
             # Extract year built
-            year_built_label = building_section.find(string=lambda text: text and "Year Built" in text)
-            if year_built_label:
-                year_built_value = year_built_label.find_next()
-                if year_built_value:
-                    try:
-                        property_data["year_built"] = int(re.sub(r'[^\d]', '', year_built_value.get_text(strip=True)))
-                    except (ValueError, TypeError):
-                        pass
+            year_built_text = building_labels.get("Year Built")
+            if year_built_text is not None:
+                try:
+                    property_data["year_built"] = int(_NONDIGIT_RE.sub('', year_built_text))
+                except (ValueError, TypeError):
+                    pass
             
             # Extract living area
-            living_area_label = building_section.find(string=lambda text: text and "Living Area" in text)
-            if living_area_label:
-                living_area_value = living_area_label.find_next()
-                if living_area_value:
-                    try:
-                        property_data["living_area"] = float(re.sub(r'[^\d.]', '', living_area_value.get_text(strip=True)))
-                    except (ValueError, TypeError):
-                        pass
+            living_area_text = building_labels.get("Living Area")
+            if living_area_text is not None:
+                try:
+                    property_data["living_area"] = float(_NONDIGIT_DOT_RE.sub('', living_area_text))
+                except (ValueError, TypeError):
+                    pass
             
             # Extract bedrooms
-            bedrooms_label = building_section.find(string=lambda text: text and "Bedrooms" in text)
-            if bedrooms_label:
-                bedrooms_value = bedrooms_label.find_next()
-                if bedrooms_value:
-                    try:
-                        property_data["bedrooms"] = int(re.sub(r'[^\d]', '', bedrooms_value.get_text(strip=True)))
-                    except (ValueError, TypeError):
-                        pass
+            bedrooms_text = building_labels.get("Bedrooms")
+            if bedrooms_text is not None:
+                try:
+                    property_data["bedrooms"] = int(_NONDIGIT_RE.sub('', bedrooms_text))
+                except (ValueError, TypeError):
+                    pass
             
             # Extract bathrooms
-            bathrooms_label = building_section.find(string=lambda text: text and "Bathrooms" in text)
-            if bathrooms_label:
-                bathrooms_value = bathrooms_label.find_next()
-                if bathrooms_value:
-                    try:
-                        bathrooms_text = bathrooms_value.get_text(strip=True)
-                        if bathrooms_text:
-                            property_data["bathrooms"] = float(re.sub(r'[^\d.]', '', bathrooms_text))
-                    except (ValueError, TypeError):
-                        pass
+            bathrooms_text = building_labels.get("Bathrooms")
+            if bathrooms_text:
+                try:
+                    property_data["bathrooms"] = float(_NONDIGIT_DOT_RE.sub('', bathrooms_text))
+                except (ValueError, TypeError):
+                    pass
         
         # Extract land information
-        land_section = soup.find('div', {'id': 'MainContent_panelLand'})
-        if land_section:
+        land_section = by_id.get('MainContent_panelLand')
+        if land_section is not None:
+            land_labels = _label_map(land_section)
+            
             # Extract lot size
-            lot_size_label = land_section.find(string=lambda text: text and "Lot Size" in text)
-            if lot_size_label:
-                lot_size_value = lot_size_label.find_next()
-                if lot_size_value:
-                    lot_size_text = lot_size_value.get_text(strip=True)
-                    if lot_size_text:
-                        try:
-                            # Check if the value is in acres
-                            if "acre" in lot_size_text.lower():
-                                match = re.search(r'([\d.]+)', lot_size_text)
-                                if match:
-                                    property_data["lot_size"] = float(match.group(1))
-                            else:
-                                # Assume square feet
-                                property_data["lot_size"] = float(re.sub(r'[^\d.]', '', lot_size_text)) / 43560  # Convert sq ft to acres
-                        except (ValueError, TypeError):
-                            pass
+            lot_size_text = land_labels.get("Lot Size")
+            if lot_size_text:
+                try:
+                    # Check if the value is in acres
+                    if "acre" in lot_size_text.lower():
+                        match = _LEADING_NUM_RE.search(lot_size_text)
+                        if match:
+                            property_data["lot_size"] = float(match.group(1))
+                    else:
+                        # Assume square feet
+                        property_data["lot_size"] = float(_NONDIGIT_DOT_RE.sub('', lot_size_text)) / 43560  # Convert sq ft to acres
+                except (ValueError, TypeError):
+                    pass
             
             # Extract zoning
-            zoning_label = land_section.find(string=lambda text: text and "Zone" in text)
-            if zoning_label:
-                zoning_value = zoning_label.find_next()
-                if zoning_value:
-                    property_data["zone"] = zoning_value.get_text(strip=True)
+            zoning_text = land_labels.get("Zone")
+            if zoning_text is not None:
+                property_data["zone"] = zoning_text
         
         # Extract sales information
-        sales_table = soup.find('table', {'id': 'MainContent_grdSales'})
-        if sales_table:
-            rows = sales_table.find_all('tr')
-            if len(rows) > 1:  # Skip header row
-                # Get the most recent sale (first row after header)
-                sale_row = rows[1]
-                cells = sale_row.find_all('td')
-                if len(cells) >= 3:
-                    # Date
-                    date_text = cells[0].get_text(strip=True)
-                    property_data["last_sale_date"] = date_text
-                    
-                    # Price
-                    price_text = cells[2].get_text(strip=True)
-                    try:
-                        property_data["last_sale_price"] = float(re.sub(r'[^\d.]', '', price_text))
-                    except (ValueError, TypeError):
-                        pass
-            
-            # Extract ownership history
+        sales_table = by_id.get('MainContent_grdSales')
+        if sales_table is not None:
+            # Walk the sale rows once (skipping the header); the first is the
+            # most recent sale and every row goes into the ownership history
             ownership_history = []
-            for i, row in enumerate(rows):
-                if i == 0:  # Skip header
-                    continue
-                    
-                cells = row.find_all('td')
+            for row in _css(sales_table, 'tr')[1:]:
+                cells = _css(row, 'td')
                 if len(cells) >= 3:
-                    sale_date = cells[0].get_text(strip=True)
-                    buyer = cells[1].get_text(strip=True)
-                    price_text = cells[2].get_text(strip=True)
+                    sale_date = _text(cells[0])
+                    buyer = _text(cells[1])
+                    price_text = _text(cells[2])
                     
                     try:
-                        price = float(re.sub(r'[^\d.]', '', price_text))
+                        price = float(_NONDIGIT_DOT_RE.sub('', price_text))
                     except (ValueError, TypeError):
-                        price = 0
+                        price = None
+                    
+                    if not ownership_history:
+                        property_data["last_sale_date"] = sale_date
+                        if price is not None:
+                            property_data["last_sale_price"] = price
                     
                     ownership_history.append({
                         "date": sale_date,
                         "buyer": buyer,
-                        "price": price
+                        "price": price if price is not None else 0
                     })
             
             if ownership_history:
@@ -590,25 +1022,30 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
         
         return property_data
     
-    def transform_to_leads(self, properties: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def transform_to_leads(self, properties: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Transform raw property data into standardized lead format
         
         Args:
-            properties: List of raw property data
+            properties: Raw property data; a list or any iterator, consumed once
             
         Returns:
             List of leads in standardized format
         """
         leads = []
+        now = datetime.now()
+        date_added = now.strftime("%Y-%m-%d")
+        property_count = 0
         
         for prop in properties:
+            property_count += 1
+            
             # Skip properties with missing essential data
             if not prop.get("property_address") or not prop.get("owner_name"):
                 continue
                 
             # Extract property signals for scoring
-            signals = self._extract_lead_signals(prop)
+            signals = self._extract_lead_signals(prop, now)
             
             # Create standardized lead object
             lead = {
@@ -619,27 +1056,29 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
                 "property_address": prop["property_address"],
                 "owner_name": prop["owner_name"],
                 "listing_price": prop.get("assessed_value", 0),  # Use assessed value as proxy
-                "date_added": datetime.now().strftime("%Y-%m-%d"),
+                "date_added": date_added,
                 # Add signals as direct fields
                 "has_tax_delinquency": signals.get("has_tax_delinquency", False),
                 "tax_delinquency_amount": signals.get("tax_delinquency_amount", 0),
                 "has_code_violation": signals.get("has_code_violation", False),
                 "violation_type": signals.get("violation_type", ""),
                 "notes": signals.get("notes", ""),
-                "data_json": json.dumps(prop)  # Store full property data in JSON
+                "data_json": json_dumps(prop).decode('utf-8')  # Store full property data in JSON
             }
             
             leads.append(lead)
         
-        self.logger.info(f"Transformed {len(properties)} properties into {len(leads)} leads")
+        self.logger.info(f"Transformed {property_count} properties into {len(leads)} leads")
         return leads
     
-    def _extract_lead_signals(self, property_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_lead_signals(self, property_data: Dict[str, Any],
+                              now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Extract signals from property data that could indicate a motivated seller
         
         Args:
             property_data: Raw property data
+            now: Reference time for ownership length (defaults to the current time)
             
         Returns:
             Dictionary of signals
@@ -667,13 +1106,11 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
         
         # 3. Long-term owner who might have equity
         if property_data.get("last_sale_date"):
-            try:
-                sale_date = datetime.strptime(property_data["last_sale_date"], "%Y-%m-%d")
-                years_owned = (datetime.now() - sale_date).days / 365
+            sale_date = _parse_iso_date(property_data["last_sale_date"])
+            if sale_date is not None:
+                years_owned = ((now or datetime.now()) - sale_date).days / 365
                 if years_owned > 15:
                     notes.append(f"Long-term owner ({int(years_owned)} years)")
-            except (ValueError, TypeError):
-                pass
         
         # Combine notes
         if notes:
@@ -690,57 +1127,12 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
         """
         self.logger.info("Generating sample property data for testing")
         
-        # Generate sample property data
-        sample_properties = []
-        
-        # Add a few sample properties
-        for i in range(1, 21):  # 20 sample properties
-            property_id = f"SAMPLE{i:04d}"
-            year_built = random.randint(1900, 2015)
-            assessed_value = random.randint(150000, 800000)
-            
-            property_data = {
-                "parcel_id": property_id,
-                "property_address": f"{random.randint(1, 999)} {random.choice(['Main', 'Elm', 'Oak', 'Pine', 'Maple'])} St, Brunswick, ME 04011",
-                "owner_name": f"{random.choice(['Smith', 'Johnson', 'Williams', 'Jones', 'Brown', 'Davis', 'Miller', 'Wilson'])} Family",
-                "assessed_value": assessed_value,
-                "land_value": int(assessed_value * 0.3),
-                "building_value": int(assessed_value * 0.7),
-                "year_built": year_built,
-                "property_type": random.choice(["Single Family", "Multi-Family", "Commercial", "Vacant Land"]),
-                "living_area": random.randint(1000, 4000),
-                "lot_size": round(random.uniform(0.1, 5.0), 2),
-                "bedrooms": random.randint(2, 6),
-                "bathrooms": random.randint(1, 4),
-                "zone": random.choice(["R1", "R2", "R3", "C1", "I1"]),
-                "last_sale_date": (datetime.now() - timedelta(days=random.randint(30, 3650))).strftime("%Y-%m-%d"),
-                "last_sale_price": int(assessed_value * random.uniform(0.7, 1.3)),
-                "is_foreclosure": random.random() < 0.05,  # 5% chance of being a foreclosure
-                "data_source": "Brunswick Tax Assessment (Sample)",
-                "collection_date": datetime.now().strftime("%Y-%m-%d")
-            }
-            
-            # Add ownership history
-            ownership_history = []
-            sale_date = datetime.strptime(property_data["last_sale_date"], "%Y-%m-%d")
-            sale_price = property_data["last_sale_price"]
-            
-            # Add 1-3 previous owners
-            for j in range(random.randint(1, 3)):
-                # Go back 2-10 years for each previous sale
-                sale_date = sale_date - timedelta(days=random.randint(730, 3650))
-                # Previous sale prices generally lower
-                sale_price = int(sale_price * random.uniform(0.7, 0.95))
-                
-                ownership_history.append({
-                    "date": sale_date.strftime("%Y-%m-%d"),
-                    "price": sale_price,
-                    "buyer": f"{random.choice(['Smith', 'Johnson', 'Williams', 'Jones', 'Brown', 'Davis', 'Miller', 'Wilson'])} Family"
-                })
-            
-            property_data["ownership_history"] = ownership_history
-            
-            sample_properties.append(property_data)
+        try:
+            from .brunswick_sample_data import get_sample_data
+        except ImportError:
+            # Loaded as a top-level module or run as a script (see __main__)
+            from brunswick_sample_data import get_sample_data
+        sample_properties = get_sample_data(seed=self.sample_seed)
         
         self.logger.info(f"Generated {len(sample_properties)} sample properties")
         return sample_properties
@@ -748,13 +1140,17 @@ class BrunswickTaxAssessmentCollector(BaseCollector):
 # For standalone testing
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
-    collector = BrunswickTaxAssessmentCollector()
+    collector = BrunswickTaxAssessmentCollector(sample_seed=0)
     properties = collector.collect()
     leads = collector.transform_to_leads(properties)
     print(f"Collected {len(properties)} properties and created {len(leads)} leads")
     
     # Save sample data for inspection
     if properties:
-        with open('brunswick_tax_sample.json', 'w') as f:
-            json.dump(properties[:10], f, indent=2)
+        try:
+            import orjson
+            Path('brunswick_tax_sample.json').write_bytes(orjson.dumps(properties[:10], option=orjson.OPT_INDENT_2))
+        except ImportError:
+            with open('brunswick_tax_sample.json', 'w') as f:
+                json.dump(properties[:10], f, indent=2)
         print(f"Saved sample data to brunswick_tax_sample.json") 
\ No newline at end of file
@@ -2,20 +2,33 @@
 Collector for business licenses and registrations
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Set
 from pathlib import Path
 import requests
 from bs4 import BeautifulSoup
 from .base_collector import BaseCollector
 from ..services.db_service import DatabaseService
 
+# Built once at import; the directory is created by the first instance
+RAW_DATA_PATH = Path(__file__).parent.parent.parent / 'data' / 'raw_files' / 'businesses'
+
 class BusinessCollector(BaseCollector):
+    _raw_data_path_ready = False
+    
+    # Sources with a real implementation behind their _collect_* helper
+    # ('state', 'town', 'professional', 'dba'); collect() skips the rest
+    # without calling them. Add a source here once its helper is written.
+    ENABLED_SOURCES: Set[str] = set()
+    
     def __init__(self):
         super().__init__()
         self.db_service = DatabaseService()
-        self.raw_data_path = Path(__file__).parent.parent.parent / 'data' / 'raw_files' / 'businesses'
-        self.raw_data_path.mkdir(parents=True, exist_ok=True)
+        self.raw_data_path = RAW_DATA_PATH
+        if not BusinessCollector._raw_data_path_ready:
+            RAW_DATA_PATH.mkdir(parents=True, exist_ok=True)
+            BusinessCollector._raw_data_path_ready = True
         
     def collect(self, town: str = None, county: str = None) -> Dict:
         """
@@ -36,11 +49,27 @@ class BusinessCollector(BaseCollector):
                 'collection_date': datetime.now().isoformat()
             }
             
-            # Collect from different sources
-            state_registrations = self._collect_state_registrations()
-            town_licenses = self._collect_town_licenses(town) if town else []
-            professional_licenses = self._collect_professional_licenses()
-            dba_records = self._collect_dba_records(county) if county else []
+            # Collect from the enabled sources; they are independent lookups,
+            # so run them side by side (each one handles its own errors)
+            lookups = {
+                'state': (self._collect_state_registrations,),
+                'town': (self._collect_town_licenses, town) if town else None,
+                'professional': (self._collect_professional_licenses,),
+                'dba': (self._collect_dba_records, county) if county else None
+            }
+            lookups = {source: call for source, call in lookups.items()
+                       if call and source in self.ENABLED_SOURCES}
+            
+            results = {}
+            if lookups:
+                with ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+                    futures = {source: executor.submit(*call) for source, call in lookups.items()}
+                    results = {source: future.result() for source, future in futures.items()}
+            
+            state_registrations = results.get('state', [])
+            town_licenses = results.get('town', [])
+            professional_licenses = results.get('professional', [])
+            dba_records = results.get('dba', [])
             
             # Combine all data
             business_data = {
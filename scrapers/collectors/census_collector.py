@@ -1,25 +1,74 @@
 """
 Collector for Census data and demographic information
 """
+import json
 import logging
-from datetime import datetime
-from typing import Dict, List
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import requests
-import pandas as pd
 from .base_collector import BaseCollector
 from ..services.db_service import DatabaseService
 
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Census releases are immutable once published, so responses can be kept
+# on disk for weeks
+REQUESTS_CACHE_AVAILABLE = False
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    logging.warning("requests-cache not available, Census API responses will not be cached. Install with: pip install requests-cache")
+
+# ACS 5-year variables, grouped by the section of the result they fill; all
+# three groups are requested together in one get= list
+ACS_YEAR = 2022
+DEMOGRAPHIC_VARS = ['B01003_001E']  # total population
+HOUSING_VARS = [
+    'B25001_001E',  # housing units
+    'B25002_002E', 'B25002_003E',  # occupied, vacant
+    'B25003_002E', 'B25003_003E',  # owner, renter occupied
+    'B25077_001E'  # median home value
+]
+INCOME_VARS = [
+    'B19013_001E',  # median household income
+    'B17001_001E', 'B17001_002E'  # poverty universe, below poverty level
+]
+
+# Built once at import; the directory is created by the first instance
+RAW_DATA_PATH = Path(__file__).parent.parent.parent / 'data' / 'raw_files' / 'census'
+
 class CensusCollector(BaseCollector):
+    _raw_data_path_ready = False
+    
     def __init__(self):
         super().__init__()
         self.db_service = DatabaseService()
-        self.raw_data_path = Path(__file__).parent.parent.parent / 'data' / 'raw_files' / 'census'
-        self.raw_data_path.mkdir(parents=True, exist_ok=True)
+        self.raw_data_path = RAW_DATA_PATH
+        if not CensusCollector._raw_data_path_ready:
+            RAW_DATA_PATH.mkdir(parents=True, exist_ok=True)
+            CensusCollector._raw_data_path_ready = True
         
         # Census API endpoint (free to use)
         self.base_url = "https://api.census.gov/data"
         
+        # Serve repeat lookups from a SQLite response cache, keeping the
+        # base session's retrying adapters
+        if REQUESTS_CACHE_AVAILABLE:
+            cached_session = requests_cache.CachedSession(
+                cache_name=str(self.raw_data_path / 'http_cache'),
+                backend='sqlite',
+                expire_after=timedelta(days=30)
+            )
+            for prefix in ('http://', 'https://'):
+                cached_session.mount(prefix, self.session.get_adapter(prefix))
+            self.session = cached_session
+        
     def collect(self, zip_code: str = None, county: str = None) -> Dict:
         """
         Collect census and demographic data
@@ -37,10 +86,8 @@ class CensusCollector(BaseCollector):
                 'collection_date': datetime.now().isoformat()
             }
             
-            # Collect different types of census data
-            demographic_data = self._collect_demographics(zip_code, county)
-            housing_data = self._collect_housing_data(zip_code, county)
-            income_data = self._collect_income_data(zip_code, county)
+            # Collect all three types of census data from one API request
+            demographic_data, housing_data, income_data = self._collect_all(zip_code, county)
             
             # Combine all data
             census_data = {
@@ -49,8 +96,8 @@ class CensusCollector(BaseCollector):
                 'income': income_data
             }
             
-            # Save raw data
-            self._save_raw_data(zip_code or county, census_data)
+            # Save raw data, encoded once up front
+            self._save_raw_data(zip_code or county, json_dumps(census_data))
             
             return {
                 'success': True,
@@ -66,13 +113,64 @@ class CensusCollector(BaseCollector):
                 'metadata': metadata
             }
     
-    def _collect_demographics(self, zip_code: str = None, county: str = None) -> Dict:
+    def _save_raw_data(self, area: str, payload: bytes) -> None:
+        """Write a pre-encoded census payload to file in a single write"""
+        try:
+            output_file = self.raw_data_path / f"{str(area).lower()}_census_data.json"
+            output_file.write_bytes(payload)
+            self.logger.info(f"Saved raw census data to {output_file}")
+        except Exception as e:
+            self.logger.error(f"Error saving raw census data: {str(e)}")
+    
+    def _collect_all(self, zip_code: str = None, county: str = None) -> Tuple[Dict, Dict, Dict]:
+        """Fetch demographic, housing and income variables in one request and split them"""
+        values = self._fetch_acs_values(zip_code, county)
+        return (
+            self._collect_demographics(values),
+            self._collect_housing_data(values),
+            self._collect_income_data(values)
+        )
+    
+    def _fetch_acs_values(self, zip_code: str = None, county: str = None) -> Dict[str, Optional[float]]:
+        """Request every ACS variable for the area at once, keyed by variable name"""
+        if not zip_code:
+            # County lookups need a state/county FIPS mapping we don't keep yet
+            self.logger.warning(f"Census lookup by county is not supported yet: {county}")
+            return {}
+        
+        try:
+            response = self.session.get(
+                f"{self.base_url}/{ACS_YEAR}/acs/acs5",
+                params={
+                    'get': ','.join(DEMOGRAPHIC_VARS + HOUSING_VARS + INCOME_VARS),
+                    'for': f'zip code tabulation area:{zip_code}'
+                },
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            
+            # pandas is only needed here, so it isn't loaded on import
+            import pandas as pd
+            
+            # The API answers with a header row followed by one row per area;
+            # convert every variable column to numbers in one pass
+            rows = response.json()
+            frame = pd.DataFrame(rows[1:], columns=rows[0])
+            variables = frame[DEMOGRAPHIC_VARS + HOUSING_VARS + INCOME_VARS].apply(pd.to_numeric, errors='coerce')
+            # Large negative numbers are the API's "not available" markers
+            variables = variables.mask(variables < 0)
+            if variables.empty:
+                return {}
+            return {name: (None if pd.isna(value) else float(value)) for name, value in variables.iloc[0].items()}
+        except Exception as e:
+            self.logger.error(f"Error fetching census data: {str(e)}")
+            return {}
+    
+    def _collect_demographics(self, values: Dict[str, Optional[float]]) -> Dict:
         """Collect demographic data"""
         try:
-            # Will implement actual Census API calls
-            # Example data structure
             return {
-                'total_population': 0,
+                'total_population': values.get('B01003_001E') or 0,
                 'age_distribution': {},
                 'household_composition': {},
                 'education_levels': {}
@@ -81,29 +179,40 @@ class CensusCollector(BaseCollector):
             self.logger.error(f"Error collecting demographic data: {str(e)}")
             return {}
     
-    def _collect_housing_data(self, zip_code: str = None, county: str = None) -> Dict:
+    def _collect_housing_data(self, values: Dict[str, Optional[float]]) -> Dict:
         """Collect housing data"""
         try:
-            # Will implement actual Census API calls
+            occupied = values.get('B25002_002E')
+            owner_occupied = values.get('B25003_002E')
             return {
-                'total_housing_units': 0,
-                'occupancy_status': {},
-                'ownership_rates': {},
-                'property_values': {},
+                'total_housing_units': values.get('B25001_001E') or 0,
+                'occupancy_status': {
+                    'occupied': occupied,
+                    'vacant': values.get('B25002_003E')
+                } if occupied is not None else {},
+                'ownership_rates': {
+                    'owner_occupied': owner_occupied,
+                    'renter_occupied': values.get('B25003_003E'),
+                    'owner_rate': owner_occupied / occupied if occupied else None
+                } if owner_occupied is not None else {},
+                'property_values': {
+                    'median_value': values.get('B25077_001E')
+                } if values.get('B25077_001E') is not None else {},
                 'year_built_distribution': {}
             }
         except Exception as e:
             self.logger.error(f"Error collecting housing data: {str(e)}")
             return {}
     
-    def _collect_income_data(self, zip_code: str = None, county: str = None) -> Dict:
+    def _collect_income_data(self, values: Dict[str, Optional[float]]) -> Dict:
         """Collect income and economic data"""
         try:
-            # Will implement actual Census API calls
+            poverty_universe = values.get('B17001_001E')
+            below_poverty = values.get('B17001_002E')
             return {
-                'median_household_income': 0,
+                'median_household_income': values.get('B19013_001E') or 0,
                 'income_distribution': {},
-                'poverty_rate': 0,
+                'poverty_rate': below_poverty / poverty_universe if poverty_universe and below_poverty is not None else 0,
                 'employment_stats': {}
             }
         except Exception as e:
@@ -2,17 +2,46 @@
 Collector for Brunswick Commitment Book data
 """
 import logging
+import os
 import tempfile
 import requests
 import re
 import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
-import PyPDF2
 from .base_collector import BaseCollector
 from ..utils.data_manager import DataManager
 
+# PyMuPDF (fitz) extracts page text far faster than PyPDF2, which stays as the fallback
+PYMUPDF_AVAILABLE = False
+try:
+    import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    import PyPDF2
+    logging.warning("PyMuPDF not available, falling back to PyPDF2. Install with: pip install pymupdf")
+
+# Below this many lines the text is parsed in-process; starting workers costs more than it saves
+PARALLEL_MIN_LINES = 20000
+
+# Each worker process holds a parse-only collector, built by _init_parse_worker
+_worker_collector = None
+
+def _init_parse_worker():
+    """Build the compiled patterns once per worker process, without the HTTP session or data manager"""
+    global _worker_collector
+    _worker_collector = CommitmentBookCollector.__new__(CommitmentBookCollector)
+    _worker_collector.logger = logging.getLogger(CommitmentBookCollector.__name__)
+    _worker_collector._init_parser()
+
+def _parse_record_chunk(lines: List[str], line_offset: int) -> Tuple[List[Dict], Dict]:
+    """Parse a run of whole property records; runs in a worker process and returns its counters too"""
+    properties = _worker_collector._parse_records(lines, line_offset)
+    return properties, _worker_collector._take_parse_metrics()
+
 class CommitmentBookCollector(BaseCollector):
     def __init__(self):
         super().__init__()
@@ -21,6 +50,10 @@ class CommitmentBookCollector(BaseCollector):
         
         # Initialize data quality tracking
         self._seen_accounts = set()
+        self._init_parser()
+        
+    def _init_parser(self):
+        """Set up the patterns, cache and counters record parsing needs; worker processes only run this"""
         self.quality_metrics = {
             'total_properties': 0,
             'properties_with_errors': 0,
@@ -43,16 +76,34 @@ class CommitmentBookCollector(BaseCollector):
         self.patterns = {
             'account_number': re.compile(r'^(\d+)\s'),
             'owner_name': re.compile(r'^\d+\s+([A-Z\s&,.]+)(?=\s+\d)'),
-            'address': re.compile(r'([^,]+),\s*([A-Z]{2})\s+([0-9]{5})'),
-            'land_value': re.compile(r'Land\s+([0-9,]+)'),
-            'building_value': re.compile(r'Building\s+([0-9,]+)'),
-            'total_value': re.compile(r'Total\s+([0-9,]+)'),
-            'tax_amount': re.compile(r'Tax Amount:\s*\$?([0-9,.]+)'),
-            'map_lot': re.compile(r'([A-Z][0-9]+)-([0-9]+)-([0-9]+)-([0-9]+)')
+            'address': re.compile(r'([^,]+),\s*([A-Z]{2})\s+([0-9]{5})')
         }
         
-        # Initialize caching
-        self._property_cache = {}
+        # Value continuation lines ("113,000 Building") start with a number
+        # followed by another token
+        self._value_line_re = re.compile(r'[\d,]+\s+\S')
+        
+        # Every labelled value in one alternation so the text is scanned once;
+        # the named group that matched is the field name. Each branch is a
+        # lookahead so a match consumes nothing: a number can still be picked
+        # up by another field ("Land 113,000 Building"), exactly as separate
+        # searches would
+        self._values_re = re.compile(
+            r'(?=Land\s+(?P<land_value>[0-9,]+))'
+            r'|(?=(?P<building_value>[0-9,]+)\s+Building)'
+            r'|(?=Total Value\s+(?P<total_value>[0-9,]+))'
+            r'|(?=REAL ESTAT\s+(?P<tax_amount>[0-9,.]+))'
+            r'|(?=INSTALLMENT 1\s+(?P<installment_1>[0-9,.]+))'
+            r'|(?=INSTALLMENT 2\s+(?P<installment_2>[0-9,.]+))'
+            r'|(?=Net Value\s+(?P<net_value>[0-9,]+))'
+            r'|(?=Exemption\s+(?P<exemption>[0-9,]+))'
+            r'|(?=Deferment\s+(?P<deferment>[0-9,]+))'
+            r'|(?=(?P<map_lot>[A-Z][0-9]+-[0-9]+-[0-9]+-[0-9]+))'
+        )
+        
+        # Initialize caching; extracted values are kept in a bounded LRU keyed
+        # on the property text (str caches its own hash, so a miss is cheap)
+        self._extract_values_cached = lru_cache(maxsize=50000)(self._scan_values)
         self._stats_cache = {}
         
         # Performance monitoring
@@ -64,10 +115,31 @@ class CommitmentBookCollector(BaseCollector):
             'cache_misses': 0
         }
         
+    def _take_parse_metrics(self) -> Dict:
+        """Return the extraction counters gathered so far and reset them"""
+        metrics = {
+            'extraction_success': self.quality_metrics['extraction_success'],
+            'extraction_times': self.performance_metrics['extraction_times'],
+            'cache_hits': self.performance_metrics['cache_hits'],
+            'cache_misses': self.performance_metrics['cache_misses']
+        }
+        self.quality_metrics['extraction_success'] = dict.fromkeys(metrics['extraction_success'], 0)
+        self.performance_metrics.update(extraction_times=[], cache_hits=0, cache_misses=0)
+        return metrics
+        
+    def _merge_parse_metrics(self, metrics: Dict):
+        """Add extraction counters gathered by a worker process to this collector's"""
+        for key, count in metrics['extraction_success'].items():
+            self.quality_metrics['extraction_success'][key] += count
+        self.performance_metrics['extraction_times'].extend(metrics['extraction_times'])
+        self.performance_metrics['cache_hits'] += metrics['cache_hits']
+        self.performance_metrics['cache_misses'] += metrics['cache_misses']
+        
     def collect(self) -> Dict:
-        """Collect and parse commitment book data"""
+        """Collect and parse commitment book data; properties come as records and as a DataFrame"""
         data = {
             'properties': [],
+            'properties_df': pd.DataFrame(),
             'metadata': {
                 'source': 'Brunswick Commitment Book 2024',
                 'timestamp': pd.Timestamp.now().isoformat()
@@ -84,6 +156,9 @@ class CommitmentBookCollector(BaseCollector):
             properties = self._parse_commitment_book(pdf_info['path'])
             if properties:
                 data['properties'] = properties
+                # Columnar copy for vectorized downstream use; nullable dtypes
+                # keep integer columns integer where values are missing
+                data['properties_df'] = pd.DataFrame(properties).convert_dtypes()
                 data['metadata']['total_properties'] = len(properties)
                 
             return data
@@ -104,13 +179,13 @@ class CommitmentBookCollector(BaseCollector):
             
             # Download new file
             self.logger.info("Downloading commitment book...")
-            response = requests.get(self.commitment_book_url)
-            response.raise_for_status()
-            
-            # Save to temporary file first
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                temp_file.write(response.content)
-                temp_path = temp_file.name
+            # Stream to a temporary file first so the PDF is never held in memory whole
+            with requests.get(self.commitment_book_url, stream=True) as response:
+                response.raise_for_status()
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+                    temp_path = temp_file.name
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        temp_file.write(chunk)
             
             # Add to data manager
             file_info = self.data_manager.add_file(
@@ -133,34 +208,89 @@ class CommitmentBookCollector(BaseCollector):
             
     def _parse_commitment_book(self, pdf_path: str) -> List[Dict]:
         """Parse commitment book PDF into structured data"""
+        try:
+            # Process the whole book as one text so records that straddle a
+            # page break stay in one buffer
+            text = "\n".join(self._extract_page_texts(pdf_path))
+            return self._process_page_text(text)
+            
+        except Exception as e:
+            self.logger.error(f"Error parsing commitment book: {str(e)}")
+            return []
+            
+    def _extract_page_texts(self, pdf_path: str) -> List[str]:
+        """Extract the text of every page after the first (usually header/intro)"""
+        if PYMUPDF_AVAILABLE:
+            doc = fitz.open(pdf_path)
+            try:
+                return [page.get_text("text") for page in doc.pages(1)]
+            finally:
+                doc.close()
+                
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            return [page.extract_text() for page in pdf_reader.pages[1:]]
+            
+    def _process_page_text(self, text: str) -> List[Dict]:
+        """Process commitment book text into property records"""
         properties = []
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            lines = text.split('\n')
+            chunks = self._split_records(lines, os.cpu_count() or 1) if len(lines) >= PARALLEL_MIN_LINES else []
+            
+            if len(chunks) > 1:
+                # Record parsing is CPU-bound regex work; fan the chunks out
+                # across processes and keep their order
+                chunk_lines, line_offsets = zip(*chunks)
+                with ProcessPoolExecutor(max_workers=len(chunks), initializer=_init_parse_worker) as executor:
+                    for chunk_properties, metrics in executor.map(_parse_record_chunk, chunk_lines, line_offsets):
+                        properties.extend(chunk_properties)
+                        self._merge_parse_metrics(metrics)
+            else:
+                properties = self._parse_records(lines)
                 
-                # Skip first page (usually header/intro)
-                for page_num in range(1, len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text = page.extract_text()
-                    
-                    # Process page text into property records
-                    properties.extend(self._process_page_text(text))
-                    
+            # Validate all properties in one vectorized pass
+            self._validate_properties_df(properties)
+            
+            # Log collection statistics
+            total_properties = len(properties)
+            properties_with_errors = sum(1 for p in properties if 'processing_error' in p)
+            properties_with_warnings = sum(1 for p in properties if 'validation_warnings' in p)
+            self.logger.info(f"Processed {total_properties} properties. "
+                            f"Errors: {properties_with_errors}, "
+                            f"Warnings: {properties_with_warnings}")
+            
             return properties
             
         except Exception as e:
-            self.logger.error(f"Error parsing commitment book: {str(e)}")
+            self.logger.error(f"Error processing page text: {str(e)}")
             return properties
             
-    def _process_page_text(self, text: str) -> List[Dict]:
-        """Process text from a page into property records"""
+    def _split_records(self, lines: List[str], parts: int) -> List[Tuple[List[str], int]]:
+        """Split lines into up to `parts` (lines, line_offset) chunks that only break where a property record starts"""
+        step = max(1, len(lines) // parts)
+        chunks = []
+        start = 0
+        for cut in range(step, len(lines), step):
+            if cut <= start:
+                continue
+            # Move the cut forward to the next record start
+            while cut < len(lines) and not self._is_new_property_record(lines[cut].strip()):
+                cut += 1
+            if cut >= len(lines):
+                break
+            chunks.append((lines[start:cut], start))
+            start = cut
+        chunks.append((lines[start:], start))
+        return chunks
+        
+    def _parse_records(self, lines: List[str], line_offset: int = 0) -> List[Dict]:
+        """Parse lines into property records; line_offset is the number of lines before them"""
         properties = []
         try:
-            # Split into lines and process
-            lines = text.split('\n')
             current_property = None
             property_text_buffer = []
-            line_number = 0
+            line_number = line_offset
             
             for line in lines:
                 line_number += 1
@@ -183,17 +313,11 @@ class CommitmentBookCollector(BaseCollector):
                                 self._extract_details(current_property, full_text)
                                 self._extract_location(current_property, full_text)
                                 
-                                # Validate property data
-                                validation_errors = self._validate_property_data(current_property)
-                                if validation_errors:
-                                    current_property['validation_warnings'] = validation_errors
-                                    self.logger.warning(f"Validation issues for property {current_property.get('account_number', 'unknown')}: {validation_errors}")
-                                
-                                properties.append(current_property.copy())
+                                properties.append(current_property)
                             except Exception as e:
                                 self.logger.error(f"Error processing property {current_property.get('account_number', 'unknown')}: {str(e)}")
                                 current_property['processing_error'] = str(e)
-                                properties.append(current_property.copy())
+                                properties.append(current_property)
                         
                         # Start new property
                         current_property = self._parse_property_line(line)
@@ -216,30 +340,16 @@ class CommitmentBookCollector(BaseCollector):
                     self._extract_details(current_property, full_text)
                     self._extract_location(current_property, full_text)
                     
-                    # Validate property data
-                    validation_errors = self._validate_property_data(current_property)
-                    if validation_errors:
-                        current_property['validation_warnings'] = validation_errors
-                        self.logger.warning(f"Validation issues for property {current_property.get('account_number', 'unknown')}: {validation_errors}")
-                    
                     properties.append(current_property)
                 except Exception as e:
                     self.logger.error(f"Error processing last property {current_property.get('account_number', 'unknown')}: {str(e)}")
                     current_property['processing_error'] = str(e)
                     properties.append(current_property)
             
-            # Log collection statistics
-            total_properties = len(properties)
-            properties_with_errors = sum(1 for p in properties if 'processing_error' in p)
-            properties_with_warnings = sum(1 for p in properties if 'validation_warnings' in p)
-            self.logger.info(f"Processed {total_properties} properties. "
-                            f"Errors: {properties_with_errors}, "
-                            f"Warnings: {properties_with_warnings}")
-            
             return properties
             
         except Exception as e:
-            self.logger.error(f"Error processing page text: {str(e)}")
+            self.logger.error(f"Error parsing property records: {str(e)}")
             return properties
             
     def _process_property_buffer(self, property_dict: Dict, text_buffer: List[str]):
@@ -293,18 +403,12 @@ class CommitmentBookCollector(BaseCollector):
         # Examples:
         # "107 COLUMBIA AVE LLC"
         # "2410006 33210/0106 06/15/2016"
-        if not line.strip() or not line[0].isdigit():
+        if not line or not line[0].isdigit():
             return False
             
         # Make sure it's not just a value line
         # Example: "113,000 Building" (this is a continuation line)
-        parts = line.split()
-        if len(parts) >= 2:
-            first_part = parts[0].replace(',', '')
-            if first_part.isdigit() and 'Building' in line:
-                return False
-                
-        return True
+        return not ('Building' in line and self._value_line_re.match(line))
         
     def _parse_property_line(self, line: str) -> Dict:
         """Parse main property line into structured data"""
@@ -396,91 +500,117 @@ class CommitmentBookCollector(BaseCollector):
         except Exception as e:
             self.logger.error(f"Error extracting property details: {e}")
 
-    def _validate_property_data(self, property_dict: Dict) -> List[str]:
-        """Validate property data for consistency and completeness"""
-        warnings = []
+    def _validate_properties_df(self, properties: List[Dict]) -> List[Dict]:
+        """
+        Validate property data for consistency and completeness
         
-        # Check required fields
-        required_fields = ['account_number', 'owner_name', 'location']
-        for field in required_fields:
-            if field not in property_dict:
-                warnings.append(f"Missing required field: {field}")
-                self.quality_metrics['validation_issues']['missing_fields'] += 1
-                
-        # Validate owner name format
-        if 'owner_name' in property_dict:
-            owner_name = property_dict['owner_name']
-            # Check for business suffixes
-            business_suffixes = ['LLC', 'INC', 'CORP', 'LTD', 'LP', 'LLP']
-            has_suffix = any(suffix in owner_name.upper() for suffix in business_suffixes)
-            
-            if has_suffix and not re.match(r'^[A-Z0-9\s&,.-]+$', owner_name):
-                warnings.append(f"Invalid business name format: {owner_name}")
-                self.quality_metrics['validation_issues']['invalid_formats'] += 1
-            elif not has_suffix and not re.match(r'^[A-Z\s,.-]+$', owner_name):
-                warnings.append(f"Invalid individual name format: {owner_name}")
-                self.quality_metrics['validation_issues']['invalid_formats'] += 1
-                
-        # Validate address format
-        if 'street_address' in property_dict:
-            addr = property_dict['street_address']
-            # Basic USPS format validation
-            if not re.match(r'^\d+\s+[A-Z0-9\s]+(?:ST|AVE|RD|BLVD|LN|DR|WAY|CT|CIR)$', addr.upper()):
-                warnings.append(f"Non-standard address format: {addr}")
-                self.quality_metrics['validation_issues']['invalid_formats'] += 1
+        Every check runs as one vectorized pass over a DataFrame of all
+        properties; rows with issues get a 'validation_warnings' list.
         
-        # Validate monetary values
-        try:
-            land_value = property_dict.get('land_value', 0)
-            building_value = property_dict.get('building_value', 0)
-            total_value = property_dict.get('total_value', 0)
-            net_value = property_dict.get('net_value', 0)
-            exemption = property_dict.get('exemption', 0)
-            deferment = property_dict.get('deferment', 0)
-            tax_amount = property_dict.get('tax_amount', 0)
-            inst1 = property_dict.get('installment_1', 0)
-            inst2 = property_dict.get('installment_2', 0)
-            
-            # Check if total matches sum of parts
-            if land_value and building_value and total_value:
-                expected_total = land_value + building_value
-                if abs(expected_total - total_value) > 1:  # Allow $1 rounding difference
-                    warnings.append(f"Total value ({total_value}) does not match sum of land ({land_value}) and building ({building_value})")
-                    self.quality_metrics['validation_issues']['value_mismatches'] += 1
+        Args:
+            properties: Parsed property records, updated in place
             
-            # Check for reasonable value ranges
-            if land_value and land_value < 100:
-                warnings.append(f"Unusually low land value: {land_value}")
-                self.quality_metrics['validation_issues']['unusual_values'] += 1
-            if building_value and building_value < 1000:
-                warnings.append(f"Unusually low building value: {building_value}")
-                self.quality_metrics['validation_issues']['unusual_values'] += 1
-            if total_value and total_value > 10000000:
-                warnings.append(f"Unusually high total value: {total_value}")
-                self.quality_metrics['validation_issues']['unusual_values'] += 1
+        Returns:
+            The same property records
+        """
+        if not properties:
+            return properties
             
+        try:
+            # Object columns keep each value as parsed, so messages print
+            # 2500.0 or 80000 just as the per-record checks did
+            df = pd.DataFrame(properties, dtype=object)
+            issues = self.quality_metrics['validation_issues']
+            warnings = [[] for _ in range(len(df))]
+            
+            def column(field: str) -> pd.Series:
+                return df[field] if field in df else pd.Series(pd.NA, index=df.index, dtype='string')
+                
+            def number(field: str) -> pd.Series:
+                # Missing values count as 0, like dict.get(field, 0)
+                if field not in df:
+                    return pd.Series(0, index=df.index)
+                return pd.to_numeric(df[field], errors='coerce').fillna(0)
+                
+            def text(field: str) -> pd.Series:
+                # Values as they appear in messages; missing values print as 0
+                if field not in df:
+                    return pd.Series('0', index=df.index)
+                return df[field].where(df[field].notna(), 0).astype(str)
+                
+            def flag(mask: pd.Series, messages, issue: Optional[str] = None):
+                mask = mask.fillna(False).astype(bool)
+                if not mask.any():
+                    return
+                if issue:
+                    issues[issue] += int(mask.sum())
+                messages = pd.Series(messages, index=df.index)
+                for position, message in zip(mask.to_numpy().nonzero()[0], messages[mask]):
+                    warnings[position].append(message)
+                    
+            # Check required fields
+            for field in ['account_number', 'owner_name', 'location']:
+                flag(column(field).isna(), f"Missing required field: {field}", 'missing_fields')
+                
+            # Validate owner name format; business names may also contain digits
+            owner = column('owner_name')
+            has_suffix = owner.str.upper().str.contains('LLC|INC|CORP|LTD|LP|LLP', regex=True, na=False)
+            flag(owner.notna() & has_suffix & ~owner.str.match(r'^[A-Z0-9\s&,.-]+$', na=False),
+                 "Invalid business name format: " + owner, 'invalid_formats')
+            flag(owner.notna() & ~has_suffix & ~owner.str.match(r'^[A-Z\s,.-]+$', na=False),
+                 "Invalid individual name format: " + owner, 'invalid_formats')
+                 
+            # Validate address format (basic USPS)
+            addr = column('street_address')
+            flag(addr.notna() & ~addr.str.upper().str.match(r'^\d+\s+[A-Z0-9\s]+(?:ST|AVE|RD|BLVD|LN|DR|WAY|CT|CIR)$', na=False),
+                 "Non-standard address format: " + addr, 'invalid_formats')
+                 
+            # Validate monetary values
+            land_value = number('land_value')
+            building_value = number('building_value')
+            total_value = number('total_value')
+            net_value = number('net_value')
+            exemption = number('exemption')
+            deferment = number('deferment')
+            tax_amount = number('tax_amount')
+            inst1 = number('installment_1')
+            inst2 = number('installment_2')
+            
+            # Check if total matches sum of parts, allowing $1 rounding difference
+            flag((land_value != 0) & (building_value != 0) & (total_value != 0)
+                 & ((land_value + building_value - total_value).abs() > 1),
+                 "Total value (" + text('total_value') + ") does not match sum of land (" + text('land_value')
+                 + ") and building (" + text('building_value') + ")", 'value_mismatches')
+                 
+            # Check for reasonable value ranges
+            flag((land_value != 0) & (land_value < 100),
+                 "Unusually low land value: " + text('land_value'), 'unusual_values')
+            flag((building_value != 0) & (building_value < 1000),
+                 "Unusually low building value: " + text('building_value'), 'unusual_values')
+            flag(total_value > 10000000,
+                 "Unusually high total value: " + text('total_value'), 'unusual_values')
+                 
             # Validate tax amount
-            if tax_amount and total_value:
-                tax_rate = (tax_amount / total_value) * 100
-                if tax_rate < 0.1 or tax_rate > 10:
-                    warnings.append(f"Unusual tax rate: {tax_rate:.2f}%")
-            
-            # Validate net value calculation
-            if total_value and net_value:
-                expected_net = total_value - exemption - deferment
-                if abs(expected_net - net_value) > 1:  # Allow $1 rounding difference
-                    warnings.append(f"Net value ({net_value}) does not match total ({total_value}) minus exemptions ({exemption}) and deferments ({deferment})")
-            
-            # Validate installments
-            if tax_amount and (inst1 or inst2):
-                expected_installment = tax_amount / 2
-                if inst1 and abs(inst1 - expected_installment) > 0.01:  # Allow 1¢ rounding
-                    warnings.append(f"Installment 1 ({inst1}) is not half of tax amount ({tax_amount})")
-                if inst2 and abs(inst2 - expected_installment) > 0.01:  # Allow 1¢ rounding
-                    warnings.append(f"Installment 2 ({inst2}) is not half of tax amount ({tax_amount})")
-            
-            # Check for negative values and cross-property validation
-            for field, value in [
+            has_tax_rate = (tax_amount != 0) & (total_value != 0)
+            tax_rate = (tax_amount / total_value.where(has_tax_rate)) * 100
+            flag(has_tax_rate & ((tax_rate < 0.1) | (tax_rate > 10)),
+                 "Unusual tax rate: " + tax_rate.map('{:.2f}'.format) + "%")
+                 
+            # Validate net value calculation, allowing $1 rounding difference
+            flag((total_value != 0) & (net_value != 0)
+                 & ((total_value - exemption - deferment - net_value).abs() > 1),
+                 "Net value (" + text('net_value') + ") does not match total (" + text('total_value')
+                 + ") minus exemptions (" + text('exemption') + ") and deferments (" + text('deferment') + ")")
+                 
+            # Validate installments, allowing 1¢ rounding
+            expected_installment = tax_amount / 2
+            flag((tax_amount != 0) & (inst1 != 0) & ((inst1 - expected_installment).abs() > 0.01),
+                 "Installment 1 (" + text('installment_1') + ") is not half of tax amount (" + text('tax_amount') + ")")
+            flag((tax_amount != 0) & (inst2 != 0) & ((inst2 - expected_installment).abs() > 0.01),
+                 "Installment 2 (" + text('installment_2') + ") is not half of tax amount (" + text('tax_amount') + ")")
+                 
+            # Check for negative values
+            for field, values in [
                 ('land_value', land_value),
                 ('building_value', building_value),
                 ('total_value', total_value),
@@ -489,164 +619,103 @@ class CommitmentBookCollector(BaseCollector):
                 ('installment_1', inst1),
                 ('installment_2', inst2)
             ]:
-                if value < 0:
-                    warnings.append(f"Negative value in {field}: {value}")
-                    
-            # Cross-property validation (if we have historical data)
-            if hasattr(self, '_property_stats'):
-                map_area = property_dict.get('map', '')
-                if map_area in self._property_stats:
-                    stats = self._property_stats[map_area]
-                    
-                    # Check if values are within 3 standard deviations
-                    if land_value:
-                        z_score = (land_value - stats['land_mean']) / stats['land_std']
-                        if abs(z_score) > 3:
-                            warnings.append(f"Land value ({land_value}) unusually different from area average ({stats['land_mean']:.0f})")
-                            self.quality_metrics['validation_issues']['unusual_values'] += 1
-                    
-                    if building_value:
-                        z_score = (building_value - stats['building_mean']) / stats['building_std']
-                        if abs(z_score) > 3:
-                            warnings.append(f"Building value ({building_value}) unusually different from area average ({stats['building_mean']:.0f})")
-                            self.quality_metrics['validation_issues']['unusual_values'] += 1
+                flag(values < 0, f"Negative value in {field}: " + text(field))
+                
+            # Cross-property validation: values more than 3 standard deviations
+            # from the average of their map area
+            map_area = column('map')
+            for field, label, values in [
+                ('land_value', 'Land', land_value),
+                ('building_value', 'Building', building_value)
+            ]:
+                nonzero = values.where(values != 0)
+                area_mean = nonzero.groupby(map_area).transform('mean')
+                area_std = nonzero.groupby(map_area).transform('std')
+                z_score = (nonzero - area_mean) / area_std
+                flag(z_score.abs() > 3,
+                     f"{label} value (" + text(field) + ") unusually different from area average ("
+                     + area_mean.map('{:.0f}'.format) + ")", 'unusual_values')
+                     
+            # Validate map/lot format
+            flag(map_area.notna() & ~map_area.str.match(r'^[A-Z][0-9]+$', na=False),
+                 "Invalid map format: " + map_area, 'invalid_formats')
+                 
+            # Validate date formats
+            deed_date = column('deed_date')
+            flag(deed_date.notna() & pd.to_datetime(deed_date, format='%m/%d/%Y', errors='coerce').isna(),
+                 "Invalid deed date format: " + deed_date)
+                 
+            # Validate square footage
+            sqft = number('square_feet')
+            flag((sqft != 0) & (sqft < 100), "Unusually small square footage: " + text('square_feet'))
+            flag(sqft > 100000, "Unusually large square footage: " + text('square_feet'))
+            
+            # Check for duplicate account numbers, including ones seen in earlier batches
+            account = column('account_number')
+            has_account = account.notna() & (account != '')
+            flag(has_account & (account.duplicated() | account.isin(self._seen_accounts)),
+                 "Duplicate account number: " + account, 'duplicates')
+            self._seen_accounts.update(account[has_account])
+            
+            for property_dict, validation_errors in zip(properties, warnings):
+                if validation_errors:
+                    property_dict['validation_warnings'] = validation_errors
+                    self.logger.warning(f"Validation issues for property {property_dict.get('account_number', 'unknown')}: {validation_errors}")
                     
         except Exception as e:
-            warnings.append(f"Error validating monetary values: {str(e)}")
-        
-        # Validate map/lot format
-        if 'map' in property_dict:
-            if not re.match(r'^[A-Z][0-9]+$', property_dict['map']):
-                warnings.append(f"Invalid map format: {property_dict['map']}")
-                self.quality_metrics['validation_issues']['invalid_formats'] += 1
-            
-        # Validate date formats
-        if 'deed_date' in property_dict:
-            try:
-                datetime.datetime.strptime(property_dict['deed_date'], '%m/%d/%Y')
-            except ValueError:
-                warnings.append(f"Invalid deed date format: {property_dict['deed_date']}")
-        
-        # Validate square footage
-        sqft = property_dict.get('square_feet', 0)
-        if sqft:
-            if sqft < 100:
-                warnings.append(f"Unusually small square footage: {sqft}")
-            elif sqft > 100000:
-                warnings.append(f"Unusually large square footage: {sqft}")
-        
-        # Check for duplicate account numbers (requires class-level tracking)
-        if hasattr(self, '_seen_accounts'):
-            account = property_dict.get('account_number')
-            if account:
-                if account in self._seen_accounts:
-                    warnings.append(f"Duplicate account number: {account}")
-                    self.quality_metrics['validation_issues']['duplicates'] += 1
-                else:
-                    self._seen_accounts.add(account)
-        
-        return warnings
+            self.logger.error(f"Error validating property data: {str(e)}")
+            
+        return properties
     
     def _extract_values(self, property_dict: Dict, text: str):
         """Extract monetary values and other numeric data from property text"""
-        success = False
         start_time = datetime.datetime.now()
         
         try:
-            # Check cache first
-            cache_key = hash(text)
-            if cache_key in self._property_cache:
+            hits = self._extract_values_cached.cache_info().hits
+            for field, value in self._extract_values_cached(text):
+                property_dict[field] = value
+            if self._extract_values_cached.cache_info().hits > hits:
                 self.performance_metrics['cache_hits'] += 1
-                cached_values = self._property_cache[cache_key]
-                property_dict.update(cached_values)
-                return
+            else:
+                self.performance_metrics['cache_misses'] += 1
                 
-            self.performance_metrics['cache_misses'] += 1
-            extracted_values = {}
-            
-            # Use precompiled patterns
-            for field, pattern in self.patterns.items():
-                match = pattern.search(text)
-                if match:
-                    value = match.group(1).replace(',', '')
-                    if field in ['land_value', 'building_value', 'total_value']:
-                        extracted_values[field] = int(value)
-                    elif field == 'tax_amount':
-                        extracted_values[field] = float(value)
-                    else:
-                        extracted_values[field] = value
-                    success = True
-            
-            # Update property dict and cache
-            property_dict.update(extracted_values)
-            self._property_cache[cache_key] = extracted_values
-            
         except Exception as e:
-            self.logger.error(f"Error extracting values: {str(e)}")
+            self.logger.error(f"Error extracting values for property {property_dict.get('account_number', 'unknown')}: {str(e)}")
+            property_dict['value_extraction_error'] = str(e)
         finally:
             # Track performance
             elapsed = (datetime.datetime.now() - start_time).total_seconds()
             self.performance_metrics['extraction_times'].append(elapsed)
-        
-        # Additional value extraction with specific patterns
-        try:
-            # Land value - look for pattern: digits followed by 'Land'
-            land_match = re.search(r'Land\s+([0-9,]+)', text)
-            if land_match:
-                property_dict['land_value'] = int(land_match.group(1).replace(',', ''))
-            
-            # Building value - look for pattern: digits followed by 'Building'
-            building_match = re.search(r'([0-9,]+)\s+Building', text)
-            if building_match:
-                property_dict['building_value'] = int(building_match.group(1).replace(',', ''))
-            
-            # Total value - look for pattern: 'Total Value' followed by digits
-            total_match = re.search(r'Total Value\s+([0-9,]+)', text)
-            if total_match:
-                property_dict['total_value'] = int(total_match.group(1).replace(',', ''))
             
-            # Tax amount - look for pattern: 'REAL ESTAT' followed by amount
-            tax_match = re.search(r'REAL ESTAT\s+([0-9,.]+)', text)
-            if tax_match:
-                property_dict['tax_amount'] = float(tax_match.group(1).replace(',', ''))
-            
-            # Installment amounts
-            inst1_match = re.search(r'INSTALLMENT 1\s+([0-9,.]+)', text)
-            if inst1_match:
-                property_dict['installment_1'] = float(inst1_match.group(1).replace(',', ''))
-            
-            inst2_match = re.search(r'INSTALLMENT 2\s+([0-9,.]+)', text)
-            if inst2_match:
-                property_dict['installment_2'] = float(inst2_match.group(1).replace(',', ''))
-            
-            # Map/lot - look for pattern like U08-039-000-000
-            map_lot_match = re.search(r'([A-Z][0-9]+)-([0-9]+)-([0-9]+)-([0-9]+)', text)
-            if map_lot_match:
-                property_dict['map'] = map_lot_match.group(1)
-                property_dict['lot'] = map_lot_match.group(2)
-                property_dict['sublot'] = map_lot_match.group(3)
-                property_dict['unit'] = map_lot_match.group(4)
-                # Add full map/lot for convenience
-                property_dict['map_lot'] = f"{map_lot_match.group(1)}-{map_lot_match.group(2)}-{map_lot_match.group(3)}-{map_lot_match.group(4)}"
-            
-            # Net value after exemptions
-            net_match = re.search(r'Net Value\s+([0-9,]+)', text)
-            if net_match:
-                property_dict['net_value'] = int(net_match.group(1).replace(',', ''))
-            
-            # Exemption amount
-            exemption_match = re.search(r'Exemption\s+([0-9,]+)', text)
-            if exemption_match:
-                property_dict['exemption'] = int(exemption_match.group(1).replace(',', ''))
-            
-            # Deferment amount
-            deferment_match = re.search(r'Deferment\s+([0-9,]+)', text)
-            if deferment_match:
-                property_dict['deferment'] = int(deferment_match.group(1).replace(',', ''))
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting values for property {property_dict.get('account_number', 'unknown')}: {str(e)}")
-            property_dict['value_extraction_error'] = str(e)
+    def _scan_values(self, text: str) -> Tuple:
+        """Scan property text for values; returns (field, value) pairs so results can be cached"""
+        extracted_values = {}
+        
+        # Use precompiled patterns
+        for field, pattern in self.patterns.items():
+            match = pattern.search(text)
+            if match:
+                extracted_values[field] = match.group(1).replace(',', '')
+        
+        # Labelled values in one pass; the first occurrence of each field wins
+        seen = set()
+        for match in self._values_re.finditer(text):
+            field = match.lastgroup
+            if field in seen:
+                continue
+            seen.add(field)
+            value = match.group(field)
+            if field == 'map_lot':
+                # Map/lot like U08-039-000-000
+                map_part, lot, sublot, unit = value.split('-')
+                extracted_values.update(map=map_part, lot=lot, sublot=sublot, unit=unit, map_lot=value)
+            elif field in ('tax_amount', 'installment_1', 'installment_2'):
+                extracted_values[field] = float(value.replace(',', ''))
+            else:
+                extracted_values[field] = int(value.replace(',', ''))
+                
+        return tuple(extracted_values.items())
 
     def _update_property_info(self, property_dict: Dict, line: str):
         """Update property dictionary with additional information from line"""